@@ -0,0 +1,206 @@
+"""Инкрементальный индекс дерева каталогов в SQLite с поиском изменений между обходами.
+
+Для каждого элемента хранятся mtime, размер и inode. mtime каталога меняется,
+только когда меняется его собственный список имён (создание, удаление,
+переименование), поэтому для каталога с прежними mtime и inode повторный
+os.scandir не нужен: список детей берётся из индекса. Спускаться в его
+подкаталоги всё равно приходится (изменения глубже не меняют mtime
+родителя), но это один stat на каталог вместо чтения всего содержимого.
+Изменение содержимого файла без изменения каталога видно только при
+stat_files=True.
+"""
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path     TEXT PRIMARY KEY,
+    parent   TEXT,
+    is_dir   INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_parent ON entries(parent);
+"""
+
+# (is_dir, size, mtime_ns, inode)
+Record = Tuple[int, int, int, int]
+
+
+@dataclass
+class IndexDiff:
+    """Изменения с прошлого обхода: пути добавленных, удалённых и изменённых элементов.
+
+    Каждый путь попадает ровно в один список. Замена файла каталогом (или
+    наоборот) с тем же именем — это modified; содержимое бывшего каталога
+    попадает в removed, нового — в added.
+    """
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    scanned_dirs: int = 0  # каталогов, прочитанных через scandir
+    skipped_dirs: int = 0  # каталогов, список которых взят из индекса
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+def _record(st: os.stat_result, is_dir: bool) -> Record:
+    return int(is_dir), 0 if is_dir else st.st_size, st.st_mtime_ns, st.st_ino
+
+
+class DirIndex:
+    """Индекс одного или нескольких деревьев в файле SQLite (":memory:" — в памяти)."""
+
+    def __init__(self, db_path: str) -> None:
+        self._conn = sqlite3.connect(db_path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "DirIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _get(self, path: str) -> Optional[Record]:
+        return self._conn.execute(
+            "SELECT is_dir, size, mtime_ns, inode FROM entries WHERE path = ?", (path,)).fetchone()
+
+    def _children(self, path: str) -> Dict[str, Record]:
+        rows = self._conn.execute(
+            "SELECT path, is_dir, size, mtime_ns, inode FROM entries WHERE parent = ?", (path,))
+        return {row[0]: row[1:] for row in rows}
+
+    def _put(self, path: str, parent: Optional[str], record: Record) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                           (path, parent, *record))
+
+    def _delete_subtree(self, path: str, diff: IndexDiff, include_self: bool = True) -> None:
+        """Удаляет всё под path (и сам path, если include_self). Диапазон [path/, path0) — все пути с префиксом path/."""
+        lo, hi = path + os.sep, path + chr(ord(os.sep) + 1)
+        where = "(path >= ? AND path < ?)"
+        params: Tuple[str, ...] = (lo, hi)
+        if include_self:
+            where, params = f"(path = ? OR {where})", (path, lo, hi)
+        rows = self._conn.execute(f"SELECT path FROM entries WHERE {where}", params)
+        diff.removed.extend(row[0] for row in rows)
+        self._conn.execute(f"DELETE FROM entries WHERE {where}", params)
+
+    def update(self, root: str, stat_files: bool = False) -> IndexDiff:
+        """Обходит root (без рекурсии, явным стеком), обновляет индекс и возвращает изменения.
+
+        Первый обход возвращает всё дерево как added. Корень в diff не попадает.
+        Время: O(изменённые каталоги * их размер + число каталогов), а не O(всех элементов).
+        """
+        root = os.path.abspath(root)
+        diff = IndexDiff()
+        with self._conn:  # одна транзакция на весь обход
+            try:
+                st = os.stat(root, follow_symlinks=False)
+            except OSError:
+                self._delete_subtree(root, diff)
+                diff.removed = [p for p in diff.removed if p != root]
+                return diff
+            stack = [(root, _record(st, True))]
+            while stack:
+                path, record = stack.pop()
+                old = self._get(path)
+                known = self._children(path)
+                if old is not None and old[0] and old[2:] == record[2:]:  # тот же каталог: mtime и inode
+                    diff.skipped_dirs += 1
+                    for child, child_old in known.items():
+                        if child_old[0]:
+                            self._descend(child, stack, diff)
+                        elif stat_files:
+                            self._check_file(child, path, child_old, diff)
+                    continue
+                diff.scanned_dirs += 1
+                self._put(path, None if path == root else os.path.dirname(path), record)
+                try:
+                    with os.scandir(path) as it:
+                        current = {}
+                        for entry in it:
+                            try:
+                                is_dir = entry.is_dir(follow_symlinks=False)
+                                current[entry.path] = _record(entry.stat(follow_symlinks=False), is_dir)
+                            except OSError:
+                                continue
+                except OSError:
+                    current = {}
+                for child in known.keys() - current.keys():
+                    self._delete_subtree(child, diff)
+                for child, new in current.items():
+                    child_old = known.get(child)
+                    if child_old is None:
+                        diff.added.append(child)
+                    elif child_old[0] != new[0]:  # файл стал каталогом или наоборот
+                        self._delete_subtree(child, diff, include_self=False)  # содержимое бывшего каталога
+                        diff.modified.append(child)
+                    elif not new[0]:
+                        if child_old == new:
+                            continue
+                        diff.modified.append(child)
+                    if new[0]:
+                        stack.append((child, new))  # запись каталога обновится при его обработке
+                    else:
+                        self._put(child, path, new)
+        return diff
+
+    def _descend(self, path: str, stack: list, diff: IndexDiff) -> None:
+        """Проверяет подкаталог неизменённого каталога одним stat и кладёт его в стек."""
+        try:
+            st = os.stat(path, follow_symlinks=False)
+        except OSError:
+            self._delete_subtree(path, diff)
+            return
+        stack.append((path, _record(st, True)))
+
+    def _check_file(self, path: str, parent: str, old: Record, diff: IndexDiff) -> None:
+        """stat файла из неизменённого каталога: фиксирует правку содержимого."""
+        try:
+            new = _record(os.stat(path, follow_symlinks=False), False)
+        except OSError:
+            self._delete_subtree(path, diff)
+            return
+        if new != old:
+            diff.modified.append(path)
+            self._put(path, parent, new)
+
+    def max_depth(self, root: str) -> int:
+        """Максимальная глубина, как max_depth_walk, но по индексу, без обращения к диску."""
+        root = os.path.abspath(root)
+        lo, hi = root + os.sep, root + chr(ord(os.sep) + 1)
+        rows = self._conn.execute(
+            "SELECT path FROM entries WHERE is_dir = 1 AND path >= ? AND path < ?", (lo, hi))
+        base = root.count(os.sep)
+        return max((row[0].count(os.sep) - base for row in rows), default=0)
+
+    def count(self, root: str) -> int:
+        """Число элементов под root в индексе."""
+        root = os.path.abspath(root)
+        lo, hi = root + os.sep, root + chr(ord(os.sep) + 1)
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE path >= ? AND path < ?", (lo, hi)).fetchone()[0]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    db = sys.argv[2] if len(sys.argv) > 2 else "dir_index.sqlite3"
+    with DirIndex(db) as index:
+        for attempt in (1, 2):
+            t0 = time.perf_counter()
+            changes = index.update(target)
+            elapsed = time.perf_counter() - t0
+            print(f"walk {attempt}: {elapsed:.3f} s, +{len(changes.added)} -{len(changes.removed)} "
+                  f"~{len(changes.modified)}, scanned {changes.scanned_dirs}, skipped {changes.skipped_dirs}")
+        print("entries:", index.count(target), "max depth:", index.max_depth(target))
@@ -0,0 +1,137 @@
+"""Параллельный обход каталогов: очередь работ вместо рекурсии, os.scandir в пуле потоков.
+
+Обход ленивый (генератор): в памяти только фронт ещё не просмотренных каталогов
+и содержимое уже просканированных, но не выданных. Глубина, число файлов
+и суммарный размер считаются за тот же проход.
+"""
+import fnmatch
+import os
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Deque, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+
+@dataclass
+class WalkEntry:
+    """Элемент обхода. depth — уровень, как отступ в walk_directory (дети корня — 0)."""
+
+    path: str
+    name: str
+    depth: int
+    is_dir: bool
+    size: int = 0  # байты для файлов, 0 для каталогов
+
+
+@dataclass
+class WalkStats:
+    """Итоги обхода. max_depth считается как в max_depth_walk (подкаталог корня — 1)."""
+
+    dirs: int = 0
+    files: int = 0
+    bytes: int = 0
+    max_depth: int = 0
+    errors: int = 0  # каталоги, которые не удалось прочитать
+
+
+def _compile_ignore(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """Шаблоны fnmatch ('*.pyc', '.git') в одно регулярное выражение по имени элемента."""
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+def _scan(path: str, depth: int, ignore: Optional[Pattern[str]]) -> Tuple[List[WalkEntry], bool]:
+    """Читает один каталог (выполняется в пуле). Возвращает (элементы, успешно ли)."""
+    entries: List[WalkEntry] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if ignore is not None and ignore.match(entry.name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append(WalkEntry(entry.path, entry.name, depth, True))
+                    else:
+                        size = entry.stat(follow_symlinks=False).st_size
+                        entries.append(WalkEntry(entry.path, entry.name, depth, False, size))
+                except OSError:  # элемент исчез между scandir и stat
+                    continue
+    except OSError:  # PermissionError, FileNotFoundError и т.п.
+        return entries, False
+    return entries, True
+
+
+def walk_parallel(root: str, max_depth: Optional[int] = None, ignore: Iterable[str] = (),
+                  workers: Optional[int] = None, stats: Optional[WalkStats] = None) -> Iterator[WalkEntry]:
+    """Лениво выдаёт все элементы под root, сканируя каталоги параллельно.
+
+    max_depth: как в walk_directory — спускаемся в каталог, если depth + 1 <= max_depth.
+    ignore: шаблоны fnmatch; совпавшие файлы пропускаются, каталоги не обходятся.
+    workers: размер пула (по умолчанию min(32, cpu + 4), как у ThreadPoolExecutor).
+    stats: если передан, заполняется по ходу обхода.
+
+    Порядок выдачи не определён (каталоги выдаются по мере готовности).
+    В полёте не больше 4 * workers сканирований, остальное ждёт в очереди путей.
+    Время O(число элементов), память O(ширина фронта).
+    """
+    pattern = _compile_ignore(ignore)
+    if stats is None:
+        stats = WalkStats()
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    in_flight_limit = 4 * workers
+    queue: Deque[Tuple[str, int]] = deque([(root, 0)])
+    running: Set[Future] = set()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        while queue or running:
+            while queue and len(running) < in_flight_limit:
+                path, depth = queue.popleft()
+                running.add(executor.submit(_scan, path, depth, pattern))
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                entries, ok = future.result()
+                if not ok:
+                    stats.errors += 1
+                for entry in entries:
+                    if entry.is_dir:
+                        stats.dirs += 1
+                        if entry.depth + 1 > stats.max_depth:
+                            stats.max_depth = entry.depth + 1
+                        if max_depth is None or entry.depth + 1 <= max_depth:
+                            queue.append((entry.path, entry.depth + 1))
+                    else:
+                        stats.files += 1
+                        stats.bytes += entry.size
+                    yield entry
+    finally:  # генератор могли закрыть раньше времени
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def walk_summary(root: str, max_depth: Optional[int] = None, ignore: Iterable[str] = (),
+                 workers: Optional[int] = None) -> WalkStats:
+    """Только итоги обхода (глубина, файлы, байты) за один проход без хранения элементов."""
+    stats = WalkStats()
+    for _ in walk_parallel(root, max_depth, ignore, workers, stats):
+        pass
+    return stats
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from recursion_tasks import max_depth_walk, walk_directory
+
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    t0 = time.perf_counter()
+    lines = walk_directory(target)
+    depth = max_depth_walk(target)
+    t1 = time.perf_counter()
+    summary = walk_summary(target)
+    t2 = time.perf_counter()
+    print(f"recursive walk_directory + max_depth_walk: {len(lines)} entries, depth {depth}, {t1 - t0:.3f} s")
+    print(f"walk_parallel: {summary.dirs + summary.files} entries, depth {summary.max_depth}, "
+          f"{summary.files} files, {summary.bytes} bytes, {t2 - t1:.3f} s")
@@ -0,0 +1,106 @@
+"""Числа Фибоначчи за O(log n): быстрое удвоение, степень матрицы, F(n) mod m."""
+from collections import OrderedDict
+from typing import Tuple
+
+from recursion import monoid_pow
+
+Matrix = Tuple[int, int, int, int]  # (a, b, c, d) = [[a, b], [c, d]]
+PISANO_LIMIT: int = 1_000_000  # период Пизано ищется перебором O(m) только для m до этого порога
+PISANO_CACHE_SIZE: int = 128  # сколько найденных периодов хранить (LRU)
+_pisano_cache: "OrderedDict[int, int]" = OrderedDict()
+
+
+def _fib_pair(n: int, m: int = 0) -> Tuple[int, int]:
+    """(F(n), F(n+1)) быстрым удвоением; при m > 0 — по модулю m.
+
+    F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2.
+    Биты n просматриваются от старшего к младшему, без рекурсии.
+    Сложность: O(log n) умножений.
+    """
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b  # F(2k+1)
+        if m:
+            c %= m
+            d %= m
+        if bit == "1":
+            a, b = d, (c + d) % m if m else c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fib_fast_doubling(n: int) -> int:
+    """n-е число Фибоначчи быстрым удвоением. O(log n) умножений больших чисел."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return _fib_pair(n)[0]
+
+
+def _mat_mul(x: Matrix, y: Matrix) -> Matrix:
+    """Произведение матриц 2x2. O(1) умножений."""
+    a, b, c, d = x
+    e, f, g, h = y
+    return a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h
+
+
+def fib_matrix(n: int) -> int:
+    """n-е число Фибоначчи как [[1, 1], [1, 0]]^n через monoid_pow. O(log n) умножений."""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return monoid_pow((1, 1, 1, 0), n, _mat_mul, (1, 0, 0, 1))[1]
+
+
+def _pisano_scan(m: int) -> int:
+    """Период Пизано перебором пар (F(i), F(i+1)) mod m. Не больше 6m шагов."""
+    if m == 1:
+        return 1
+    a, b = 0, 1
+    for i in range(1, 6 * m + 1):
+        a, b = b, (a + b) % m
+        if a == 0 and b == 1:
+            return i
+    raise AssertionError("Pisano period not found")  # невозможно: период <= 6m
+
+
+def pisano_period(m: int) -> int:
+    """Период последовательности F(n) mod m (период Пизано).
+
+    Время O(m), не больше 6m шагов; последние PISANO_CACHE_SIZE
+    результатов кешируются (LRU), повторный запрос — O(1).
+    """
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m in _pisano_cache:
+        _pisano_cache.move_to_end(m)
+        return _pisano_cache[m]
+    period = _pisano_scan(m)
+    _pisano_cache[m] = period
+    if len(_pisano_cache) > PISANO_CACHE_SIZE:
+        _pisano_cache.popitem(last=False)
+    return period
+
+
+def fib_mod(n: int, m: int) -> int:
+    """F(n) mod m.
+
+    Быстрое удвоение по модулю: числа не превышают m^2, время O(log n).
+    n сокращается по периоду Пизано, только если период уже в кеше или
+    перебор O(m) дешевле удвоения (log n > 6m, m <= PISANO_LIMIT);
+    иначе поиск периода обошёлся бы дороже самого вычисления.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m in _pisano_cache or (m <= PISANO_LIMIT and n.bit_length() > 6 * m):
+        n %= pisano_period(m)
+    return _fib_pair(n, m)[0]
+
+
+if __name__ == "__main__":
+    print("F(100) =", fib_fast_doubling(100))
+    print("F(100) =", fib_matrix(100))
+    print("F(10**18) mod 10**9+7 =", fib_mod(10 ** 18, 10 ** 9 + 7))
+    print("pi(10) =", pisano_period(10))  # 60
@@ -0,0 +1,142 @@
+"""Ханойские башни без списка ходов: ленивый генератор, k-й ход напрямую, двоичный экспорт.
+
+Ход номер m (1 .. 2^n - 1) в оптимальном решении определяется битами m:
+переносится диск (число младших нулей m) + 1, со стержня (m & (m - 1)) % 3
+на стержень ((m | (m - 1)) + 1) % 3. Эта формула переносит башню со
+стержня 0 на стержень 2 при нечётном n и на стержень 1 при чётном, поэтому
+для чётного n aux и dst меняются местами.
+"""
+import struct
+import time
+import tracemalloc
+from typing import BinaryIO, Iterator, List, Tuple
+
+from recursion_tasks import hanoi_moves
+
+# Заголовок файла: сигнатура, n, число ходов
+_MAGIC = b"HANOI1"
+_HEADER = struct.Struct("<6sBQ")
+# (откуда, куда) в номерах стержней 0..2 -> код 0..5; два хода в одном байте
+_CODES = {(0, 1): 0, (0, 2): 1, (1, 0): 2, (1, 2): 3, (2, 0): 4, (2, 1): 5}
+_PAIRS = {code: pair for pair, code in _CODES.items()}
+EXPORT_CHUNK: int = 1 << 20  # ходов на один блок записи
+
+
+def _pegs(n: int, src: str, aux: str, dst: str) -> Tuple[str, str, str]:
+    """Имена стержней 0, 1, 2 для формулы с учётом чётности n."""
+    return (src, aux, dst) if n % 2 else (src, dst, aux)
+
+
+def _move(m: int) -> Tuple[int, int]:
+    """Ход номер m (с 1) в номерах стержней. O(1) для машинных m, O(n) битовых операций в общем случае."""
+    return (m & (m - 1)) % 3, ((m | (m - 1)) + 1) % 3
+
+
+def hanoi_iter(n: int, src: str = "A", aux: str = "B", dst: str = "C") -> Iterator[Tuple[str, str]]:
+    """Лениво выдаёт те же ходы, что hanoi_moves, в том же порядке.
+
+    Временная сложность: O(2^n) всего, O(1) на ход.
+    Пространственная сложность: O(1) — ни списка, ни стека рекурсии.
+    """
+    pegs = _pegs(n, src, aux, dst)
+    for m in range(1, (1 << n) if n > 0 else 1):
+        a, b = _move(m)
+        yield pegs[a], pegs[b]
+
+
+def hanoi_move_at(n: int, k: int, src: str = "A", aux: str = "B", dst: str = "C") -> Tuple[str, str]:
+    """k-й ход (с 0, как индекс в hanoi_moves) без вычисления предыдущих.
+
+    Временная сложность: O(n) — операции над n-битным числом.
+    """
+    if not 0 <= k < (1 << n) - 1:
+        raise IndexError("move index out of range")
+    a, b = _move(k + 1)
+    pegs = _pegs(n, src, aux, dst)
+    return pegs[a], pegs[b]
+
+
+def hanoi_disk_at(k: int) -> int:
+    """Номер диска (1 — самый маленький), который переносится k-м ходом (с 0). O(n)."""
+    m = k + 1
+    return (m & -m).bit_length()
+
+
+def export_moves(n: int, f: BinaryIO, chunk: int = EXPORT_CHUNK) -> int:
+    """Записывает все ходы для n дисков в двоичный поток: 4 бита на ход, два хода в байте.
+
+    Ходы пишутся в номерах стержней 0..2 (0 — исходный, 2 — целевой);
+    генерируются блоками по chunk ходов, поэтому память O(chunk).
+    Возвращает число записанных байт (без заголовка).
+    """
+    total = (1 << n) - 1 if n > 0 else 0
+    f.write(_HEADER.pack(_MAGIC, n, total))
+    # Перестановка стержней формулы в порядок (исходный, вспомогательный, целевой)
+    order = (0, 1, 2) if n % 2 else (0, 2, 1)
+    codes = {(a, b): _CODES[order[a], order[b]] for a, b in _CODES}
+    written = 0
+    chunk = max(2, chunk - chunk % 2)  # целое число байт в каждом блоке, кроме последнего
+    for start in range(1, total + 1, chunk):
+        stop = min(start + chunk, total + 1)
+        nibbles = [codes[(m & (m - 1)) % 3, ((m | (m - 1)) + 1) % 3] for m in range(start, stop)]
+        if len(nibbles) % 2:
+            nibbles.append(0)
+        data = bytes(hi << 4 | lo for hi, lo in zip(nibbles[::2], nibbles[1::2]))
+        f.write(data)
+        written += len(data)
+    return written
+
+
+def import_moves(f: BinaryIO, src: str = "A", aux: str = "B", dst: str = "C",
+                 chunk: int = EXPORT_CHUNK) -> Iterator[Tuple[str, str]]:
+    """Лениво читает ходы, записанные export_moves. Память O(chunk)."""
+    magic, n, total = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != _MAGIC:
+        raise ValueError("not a Hanoi moves file")
+    names = (src, aux, dst)
+    pairs = [(names[a], names[b]) for a, b in (_PAIRS[c] for c in range(6))]
+    left = total
+    while left > 0:
+        data = f.read(chunk)
+        if not data:
+            raise ValueError("truncated Hanoi moves file")
+        for byte in data:
+            yield pairs[byte >> 4]
+            left -= 1
+            if not left:
+                return
+            yield pairs[byte & 0x0F]
+            left -= 1
+            if not left:
+                return
+
+
+def compare_memory(list_ns: List[int], stream_ns: List[int]) -> List[Tuple[str, int, float, float]]:
+    """Пиковая память (КБ, tracemalloc) и время hanoi_moves (список) и hanoi_iter (генератор).
+
+    Время замеряется отдельным прогоном без tracemalloc: трассировка каждой
+    аллокации сильно замедляет генератор.
+    Возвращает (вариант, n, пик КБ, время сек).
+    """
+    results = []
+    for label, ns, run in (("hanoi_moves", list_ns, lambda n: len(hanoi_moves(n, "A", "B", "C"))),
+                           ("hanoi_iter", stream_ns, lambda n: sum(1 for _ in hanoi_iter(n)))):
+        for n in ns:
+            t0 = time.perf_counter()
+            run(n)
+            elapsed = time.perf_counter() - t0
+            tracemalloc.start()
+            run(n)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append((label, n, peak / 1024, elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    print("Первые ходы n=3:", list(hanoi_iter(3)))
+    print("Ход 2^40 - 2 при n=64:", hanoi_move_at(64, (1 << 40) - 2))
+    print(f"{'variant':>12} | {'n':>3} | {'peak KB':>12} | {'time s':>8}")
+    print("-" * 46)
+    for label, n, peak_kb, elapsed in compare_memory([12, 16, 20], [12, 16, 20]):
+        print(f"{label:>12} | {n:3d} | {peak_kb:12.1f} | {elapsed:8.3f}")
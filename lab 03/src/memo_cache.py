@@ -0,0 +1,291 @@
+"""Декоратор мемоизации с ограниченным кешем, политиками вытеснения и статистикой.
+
+Политики: 'lru' (давно не использованный), 'lfu' (редко используемый),
+'ttl' (время жизни записи, затем — самая старая). Размер ограничивается
+числом записей (maxsize) и/или байтами (max_bytes, по sys.getsizeof значения).
+Статистика ведётся отдельно для каждой функции и защищена блокировкой.
+Необязательный дисковый уровень (shelve) сохраняет результаты между запусками.
+"""
+import functools
+import shelve
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass
+class CacheStats:
+    """Счётчики одной функции: вызовы, попадания, промахи, вытеснения, занятые байты."""
+
+    calls: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes: int = 0
+    disk_hits: int = 0
+    size: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.calls = self.hits = self.misses = self.evictions = self.bytes = self.disk_hits = self.size = 0
+
+
+class LRUPolicy:
+    """Вытесняет давно не использовавшуюся запись. Все операции O(1)."""
+
+    def __init__(self) -> None:
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        if key not in self._data:
+            return False, None
+        self._data.move_to_end(key)
+        return True, self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+    def evict(self) -> Tuple[Hashable, Any]:
+        return self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class LFUPolicy:
+    """Вытесняет запись с наименьшим числом обращений (при равенстве — самую старую). O(1)."""
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_freq = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _touch(self, key: Hashable) -> None:
+        f = self._freq[key]
+        bucket = self._buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[f]
+            if self._min_freq == f:
+                self._min_freq = f + 1
+        self._freq[key] = f + 1
+        self._buckets.setdefault(f + 1, OrderedDict())[key] = None
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        if key not in self._values:
+            return False, None
+        self._touch(key)
+        return True, self._values[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if key in self._values:
+            self._values[key] = value
+            self._touch(key)
+            return
+        self._values[key] = value
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def evict(self) -> Tuple[Hashable, Any]:
+        bucket = self._buckets[self._min_freq]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_freq]
+            self._min_freq = min(self._buckets, default=0)
+        del self._freq[key]
+        return key, self._values.pop(key)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._freq.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+class TTLPolicy:
+    """Запись живёт ttl секунд; при переполнении вытесняется самая старая. O(1) амортизированно."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()  # в порядке записи
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        item = self._data.get(key)
+        if item is None:
+            return False, None
+        expires, value = item
+        if expires < self._clock():
+            return False, None  # запись устарела; удалит её expired()
+        return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (self._clock() + self.ttl, value)
+
+    def expired(self) -> List[Tuple[Hashable, Any]]:
+        """Удаляет устаревшие записи с начала (они записаны раньше всех)."""
+        now = self._clock()
+        removed = []
+        while self._data:
+            key, (expires, value) = next(iter(self._data.items()))
+            if expires >= now:
+                break
+            del self._data[key]
+            removed.append((key, value))
+        return removed
+
+    def evict(self) -> Tuple[Hashable, Any]:
+        key, (_, value) = self._data.popitem(last=False)
+        return key, value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """Ключ кеша из аргументов вызова (аргументы должны быть хешируемыми)."""
+    if kwargs:
+        return args + (object,) + tuple(sorted(kwargs.items()))
+    if len(args) == 1 and type(args[0]) in (int, str):  # как в functools: быстрый ключ
+        return args[0]
+    return args
+
+
+def memoize(policy: str = "lru", maxsize: Optional[int] = 128, max_bytes: Optional[int] = None,
+            ttl: Optional[float] = None, disk_path: Optional[str] = None):
+    """Декоратор мемоизации.
+
+    policy: 'lru', 'lfu' или 'ttl' (для 'ttl' нужен ttl в секундах).
+    maxsize: максимум записей (None — без ограничения по числу).
+    max_bytes: бюджет памяти на значения (оценка sys.getsizeof).
+    disk_path: файл shelve — второй уровень кеша, переживающий перезапуск.
+        Ключ на диске — "модуль.имя_функции:" + repr(аргументов), поэтому
+        несколько функций могут делить один файл, а аргументы должны иметь
+        стабильный repr (числа, строки, кортежи; не объекты с адресом в repr).
+
+    У обёрнутой функции есть cache_stats (CacheStats) и cache_clear().
+    Функция вычисляется вне блокировки, поэтому рекурсия и параллельные
+    вызовы не блокируют друг друга (одно значение может вычислиться дважды).
+    """
+    if policy == "ttl" and ttl is None:
+        raise ValueError("policy 'ttl' requires ttl")
+
+    def decorator(func: Callable) -> Callable:
+        if policy == "lru":
+            store: Any = LRUPolicy()
+        elif policy == "lfu":
+            store = LFUPolicy()
+        elif policy == "ttl":
+            store = TTLPolicy(ttl)
+        else:
+            raise ValueError(f"Unknown policy: {policy}")
+        stats = CacheStats()
+        sizes: Dict[Hashable, int] = {}
+        disk: Dict[str, Any] = {}  # открытый shelve (лениво)
+        disk_prefix = f"{func.__module__}.{func.__qualname__}:"
+
+        def open_disk():
+            if "db" not in disk:
+                disk["db"] = shelve.open(disk_path)
+            return disk["db"]
+
+        def drop(key: Hashable) -> None:
+            stats.bytes -= sizes.pop(key, 0)
+
+        def store_value(key: Hashable, value: Any) -> None:
+            size = sys.getsizeof(value)
+            if max_bytes is not None and size > max_bytes:
+                return  # значение больше всего бюджета — не кешируем
+            if maxsize == 0:
+                return
+            if key in sizes:
+                drop(key)
+            store.put(key, value)
+            sizes[key] = size
+            stats.bytes += size
+            if isinstance(store, TTLPolicy):
+                for old_key, _ in store.expired():
+                    drop(old_key)
+            while (maxsize is not None and len(store) > maxsize) or \
+                    (max_bytes is not None and stats.bytes > max_bytes):
+                old_key, _ = store.evict()
+                drop(old_key)
+                stats.evictions += 1
+            stats.size = len(store)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            with stats.lock:
+                stats.calls += 1
+                hit, value = store.get(key)
+                if hit:
+                    stats.hits += 1
+                    return value
+                if disk_path is not None:
+                    db = open_disk()
+                    disk_key = disk_prefix + repr(key)
+                    if disk_key in db:
+                        stats.disk_hits += 1
+                        stats.hits += 1
+                        value = db[disk_key]
+                        store_value(key, value)
+                        return value
+                stats.misses += 1
+            value = func(*args, **kwargs)  # вне блокировки
+            with stats.lock:
+                store_value(key, value)
+                if disk_path is not None:
+                    open_disk()[disk_prefix + repr(key)] = value
+            return value
+
+        def cache_clear() -> None:
+            """Очищает память (не диск) и обнуляет статистику."""
+            with stats.lock:
+                store.clear()
+                sizes.clear()
+            stats.reset()
+
+        def cache_close() -> None:
+            """Закрывает дисковый уровень (данные сохраняются в файле)."""
+            with stats.lock:
+                if "db" in disk:
+                    disk.pop("db").close()
+
+        wrapper.cache_stats = stats
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_close = cache_close
+        return wrapper
+
+    return decorator
+
+
+def count_calls(func: Callable) -> Callable:
+    """Считает вызовы функции в её собственном CacheStats (без кеширования)."""
+    stats = CacheStats()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with stats.lock:
+            stats.calls += 1
+        return func(*args, **kwargs)
+
+    wrapper.cache_stats = stats
+    return wrapper
@@ -1,25 +1,25 @@
+import sys
 import time
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Callable, List, Tuple
+from typing import Callable, Dict, Iterator, List, Tuple
 
 import matplotlib.pyplot as plt
 
-
-# Глобальные счётчики вызовов
-call_count_naive: int = 0
-call_count_memo: int = 0
+from fibonacci import fib_fast_doubling, fib_matrix
+from memo_cache import count_calls, memoize
 
 
 # Временная сложность: O(phi^n) — экспоненциальная (phi ≈ 1.618...)
 # Пространственная сложность (стек рекурсии): O(n)
+# Число вызовов — fibonacci_naive.cache_stats.calls
+@count_calls
 def fibonacci_naive(n: int) -> int:
     """
     Наивная рекурсивная реализация Фибоначчи.
 
     Сложность: время O(phi^n), память (стек) O(n).
     """
-    global call_count_naive
-    call_count_naive += 1
     if n <= 1:
         return n
     return fibonacci_naive(n - 1) + fibonacci_naive(n - 2)
@@ -27,15 +27,17 @@ def fibonacci_naive(n: int) -> int:
 
 # Временная сложность: O(n) — каждое значение 0..n вычисляется один раз благодаря кешу
 # Пространственная сложность: O(n) — кеш + глубина рекурсии
-@lru_cache(maxsize=None)
+# Число вычислений тела — fibonacci_memo.cache_stats.misses
+# Обёртка memoize написана на Python, поэтому каждый уровень рекурсии занимает
+# два кадра стека (обёртка + тело): без with_recursion_limit предельное n
+# вдвое меньше, чем с functools.lru_cache (~490 вместо ~990 при лимите 1000).
+@memoize(policy="lru", maxsize=1024)
 def fibonacci_memo(n: int) -> int:
     """
-    Рекурсивная реализация Фибоначчи с мемоизацией (LRU-кеш).
+    Рекурсивная реализация Фибоначчи с мемоизацией (ограниченный LRU-кеш).
 
     Сложность: время O(n), память O(n) (кеш + стек).
     """
-    global call_count_memo
-    call_count_memo += 1
     if n <= 1:
         return n
     return fibonacci_memo(n - 1) + fibonacci_memo(n - 2)
@@ -77,6 +79,122 @@ def save_time_plot(ns: List[int], naive_times: List[float], memo_times: List[flo
     plt.close()
 
 
+# Кадров стека на один уровень рекурсии с запасом: обёртка memoize + тело функции
+FRAMES_PER_LEVEL: int = 2
+RECURSION_MARGIN: int = 200
+
+
+@contextmanager
+def with_recursion_limit(depth: int) -> Iterator[None]:
+    """Временно поднимает sys.getrecursionlimit() так, чтобы хватило depth уровней мемоизированной рекурсии."""
+    old = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(old, FRAMES_PER_LEVEL * depth + RECURSION_MARGIN))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(old)
+
+
+def compare_with_lru_cache(n: int = 500, repeats: int = 200) -> List[Tuple[str, str, float, int]]:
+    """Сравнивает memoize (lru/lfu/ttl) с functools.lru_cache на рекурсивных задачах.
+
+    Задачи: Фибоначчи и число путей в сетке n x n (две рекурсивные ветви).
+    Глубина рекурсии — до n уровней, поэтому замер идёт под with_recursion_limit.
+    Возвращает (задача, кеш, время одного прогона в мс, промахи).
+    """
+    def fib_factory(decorator):
+        @decorator
+        def fib(k: int) -> int:
+            return k if k <= 1 else fib(k - 1) + fib(k - 2)
+        return fib
+
+    def grid_factory(decorator):
+        @decorator
+        def paths(r: int, c: int) -> int:
+            return 1 if r == 0 or c == 0 else paths(r - 1, c) + paths(r, c - 1)
+        return paths
+
+    caches = {
+        "functools.lru_cache": lru_cache(maxsize=None),
+        "memoize(lru)": memoize("lru", maxsize=None),
+        "memoize(lfu)": memoize("lfu", maxsize=None),
+        "memoize(ttl)": memoize("ttl", maxsize=None, ttl=60.0),
+        "memoize(lru, 64 KB)": memoize("lru", maxsize=None, max_bytes=64 * 1024),
+    }
+    grid = min(n, 60)
+    workloads = {
+        f"fib({n})": (fib_factory, (n,)),
+        f"grid_paths({grid},{grid})": (grid_factory, (grid, grid)),
+    }
+    results = []
+    for task, (factory, args) in workloads.items():
+        for name, decorator in caches.items():
+            func = factory(decorator)
+            with with_recursion_limit(sum(args)):
+                t0 = time.perf_counter()
+                for _ in range(repeats):
+                    func.cache_clear()
+                    func(*args)
+                elapsed = (time.perf_counter() - t0) / repeats * 1000
+            stats = getattr(func, "cache_stats", None)
+            misses = stats.misses if stats is not None else func.cache_info().misses
+            results.append((task, name, elapsed, misses))
+            print(f"{task:>22} | {name:>20} | {elapsed:9.4f} ms | misses={misses}")
+    return results
+
+
+# Наибольшее n для каждого варианта: наивный экспоненциален, мемоизированный
+# ограничен глубиной рекурсии (замер идёт под with_recursion_limit, но кеш
+# maxsize=1024 и стек не бесконечны), O(log n)-варианты доходят до миллионов.
+FIB_VARIANT_LIMITS: Dict[str, int] = {
+    "naive": 30,
+    "memo": 1000,
+    "matrix": 10 ** 6,
+    "fast_doubling": 10 ** 6,
+}
+
+
+def compare_fib_variants(ns: List[int]) -> Dict[str, List[Tuple[int, float]]]:
+    """Время (сек) всех вариантов Фибоначчи для каждого n в пределах FIB_VARIANT_LIMITS."""
+    funcs: Dict[str, Callable[[int], int]] = {
+        "naive": fibonacci_naive,
+        "memo": fibonacci_memo,
+        "matrix": fib_matrix,
+        "fast_doubling": fib_fast_doubling,
+    }
+    results: Dict[str, List[Tuple[int, float]]] = {name: [] for name in funcs}
+    print(f"{'n':>8} | " + " | ".join(f"{name:>13}" for name in funcs))
+    for n in ns:
+        row = []
+        for name, func in funcs.items():
+            if n > FIB_VARIANT_LIMITS[name]:
+                row.append(f"{'-':>13}")
+                continue
+            with with_recursion_limit(n):
+                t = measure_time(func, n, runs=1 if name == "naive" else 3)
+            results[name].append((n, t))
+            row.append(f"{t:13.6f}")
+        print(f"{n:8d} | " + " | ".join(row))
+    return results
+
+
+def save_variants_plot(results: Dict[str, List[Tuple[int, float]]], fname: str) -> None:
+    """График времени вариантов Фибоначчи в логарифмическом масштабе по обеим осям."""
+    plt.figure(figsize=(8, 5))
+    for name, points in results.items():
+        if points:
+            plt.plot([n for n, _ in points], [t for _, t in points], marker="o", label=name)
+    plt.xscale("log")
+    plt.yscale("log")
+    plt.title("Варианты вычисления чисел Фибоначчи")
+    plt.xlabel("n")
+    plt.ylabel("Время (сек)")
+    plt.grid(True, which="both", linestyle="--", linewidth=0.5)
+    plt.legend()
+    plt.savefig(fname, dpi=300, bbox_inches="tight")
+    plt.close()
+
+
 def main() -> None:
     """Запускает эксперимент и сохраняет результаты."""
     ns: List[int] = list(range(5, 36, 5))
@@ -87,19 +205,18 @@ def main() -> None:
 
     for n in ns:
         # Сбрасываем счётчики
-        global call_count_naive, call_count_memo
-        call_count_naive = 0
-        call_count_memo = 0
+        fibonacci_naive.cache_stats.reset()
 
         # Наивная версия (внимание: для n > ~30 долго)
         t_naive = measure_time(fibonacci_naive, n, runs=1)
         naive_times.append(t_naive)
-        naive_calls.append(call_count_naive)
+        naive_calls.append(fibonacci_naive.cache_stats.calls)
 
-        # Мемоизированная версия (несколько прогонов для устойчивости)
+        # Мемоизированная версия (несколько прогонов для устойчивости);
+        # measure_time очищает кеш и его статистику
         t_memo = measure_time(fibonacci_memo, n, runs=3)
         memo_times.append(t_memo)
-        memo_calls.append(call_count_memo)
+        memo_calls.append(fibonacci_memo.cache_stats.misses)
 
     # Печать результатов
     print(f"{'n':>3} | {'naive(s)':>10} | {'naive_calls':>11} | {'memo(s)':>10} | {'memo_calls':>10}")
@@ -113,6 +230,13 @@ def main() -> None:
     # Сохранение графика времени
     save_time_plot(ns, naive_times, memo_times, fname="fib_time_comparison.png")
 
+    print("\nВарианты Фибоначчи (сек):")
+    variant_ns = [10, 20, 30, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]
+    save_variants_plot(compare_fib_variants(variant_ns), fname="fib_variants_log.png")
+
+    print("\nmemoize vs functools.lru_cache:")
+    compare_with_lru_cache()
+
 
 if __name__ == "__main__":
     main()
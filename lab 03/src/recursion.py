@@ -1,4 +1,8 @@
-from typing import Dict, Optional
+import operator
+from fractions import Fraction
+from typing import Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 PC_INFO: str = (
     "Характеристики ПК для тестирования:\n"
@@ -23,6 +27,33 @@ def factorial(n: int) -> int:
     return n * factorial(n - 1)  # рекурсивный шаг: O(1) * O(n-1) => O(n)
 
 
+FACTORIAL_LOOP_THRESHOLD: int = 64  # до этого n простой цикл быстрее дерева произведений
+
+
+def factorial_iterative(n: int) -> int:
+    """Факториал без рекурсии, результат совпадает с factorial.
+
+    Для больших n — бинарное разбиение (дерево произведений): множители
+    перемножаются попарно уровнями, поэтому большие числа перемножаются
+    с близкими по размеру, что выгодно для умножения Карацубы.
+    Временная сложность: O(n) умножений, память O(n) на одном уровне дерева.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if n <= FACTORIAL_LOOP_THRESHOLD:
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+    level = list(range(2, n + 1))
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
 def fib_naive(n: int) -> int:
     """Наивный рекурсивный расчёт n-го числа Фибоначчи.
 
@@ -58,8 +89,159 @@ def fast_pow(a: float, n: int) -> float:
     return a * fast_pow(a, n - 1)
 
 
+def fib_naive_iterative(n: int) -> int:
+    """fib_naive с явным стеком вместо рекурсии: та же экспоненциальная работа.
+
+    Нужен для сравнения накладных расходов вызова функции с ручным стеком.
+    Временная сложность: O(phi^n), память (стек-список) O(n).
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    total = 0
+    stack = [n]
+    while stack:
+        k = stack.pop()
+        if k < 2:  # базовый случай
+            total += k
+        else:
+            stack.append(k - 1)
+            stack.append(k - 2)
+    return total
+
+
+def fast_pow_iterative(a: float, n: int) -> float:
+    """fast_pow без рекурсии: биты n просматриваются от старшего к младшему.
+
+    Порядок умножений тот же, что в рекурсивной версии, поэтому и результат
+    с плавающей точкой совпадает бит в бит.
+    Временная сложность: O(log n), память O(1).
+    """
+    if n < 0:
+        return 1.0 / fast_pow_iterative(a, -n)
+    result = 1.0
+    for bit in bin(n)[2:] if n else "":
+        result = result * result
+        if bit == "1":
+            result = a * result
+    return result
+
+
+# Ширина окна по длине показателя в битах (как в GMP): (предел бит, окно)
+_WINDOW_TABLE = ((8, 1), (24, 2), (80, 3), (240, 4), (672, 5), (1792, 6))
+
+
+def _window_size(bits: int) -> int:
+    """Ширина окна, при которой предвычисление нечётных степеней окупается."""
+    for limit, width in _WINDOW_TABLE:
+        if bits <= limit:
+            return width
+    return 7
+
+
+def power(x: T, n: int, mul: Optional[Callable[[T, T], T]] = None,
+          identity: Optional[T] = None, window: Optional[int] = None) -> T:
+    """Итеративное возведение в степень скользящим окном (square-and-multiply).
+
+    mul — ассоциативное умножение (по умолчанию *), подходит для матриц,
+    многочленов, чисел по модулю. Тип результата — тип x: int, Fraction
+    и Decimal остаются точными (Decimal — с точностью текущего контекста).
+    identity нужен только для n == 0 при своём mul; для чисел это type(x)(1).
+    Отрицательный n — только для чисел: 1 / x^|n| (для int — Fraction).
+    window — ширина окна в битах (None — по длине n, 1 — обычный двоичный метод).
+
+    Биты n просматриваются от старшего к младшему; окно из w бит
+    с нечётным значением v заменяет до w умножений одним умножением на
+    заранее посчитанное x^v. Умножение на единицу не выполняется.
+    Временная сложность: O(log n) возведений в квадрат + O(log n / w + 2^(w-1)) умножений.
+    Пространственная сложность: O(2^(w-1)) предвычисленных степеней, без рекурсии.
+    """
+    if n < 0:
+        if mul is not None:
+            raise ValueError("negative n needs a numeric x")
+        result = power(x, -n, window=window)
+        return Fraction(1, result) if isinstance(result, int) else 1 / result
+    if mul is None:
+        mul = operator.mul
+    if n == 0:
+        if identity is not None:
+            return identity
+        if mul is operator.mul:
+            return type(x)(1)
+        raise ValueError("identity is required for n == 0 with a custom mul")
+    bits = n.bit_length()
+    w = window if window is not None else _window_size(bits)
+    # Нечётные степени x^1, x^3, ..., x^(2^w - 1)
+    odd: List[T] = [x]
+    if w > 1:
+        square = mul(x, x)
+        for _ in range((1 << (w - 1)) - 1):
+            odd.append(mul(odd[-1], square))
+    result: Optional[T] = None
+    i = bits - 1
+    while i >= 0:
+        if not (n >> i) & 1:
+            result = mul(result, result)  # result уже есть: старший бит n равен 1
+            i -= 1
+            continue
+        # Самое длинное окно [j, i] не шире w, заканчивающееся единицей
+        j = max(i - w + 1, 0)
+        while not (n >> j) & 1:
+            j += 1
+        value = (n >> j) & ((1 << (i - j + 1)) - 1)
+        if result is not None:
+            for _ in range(i - j + 1):
+                result = mul(result, result)
+            result = mul(result, odd[value >> 1])
+        else:
+            result = odd[value >> 1]
+        i = j - 1
+    return result
+
+
+def pow_mod(x: int, n: int, m: int, window: Optional[int] = None) -> int:
+    """x^n mod m для целых; числа не превышают m^2. Отрицательный n — через обратный по модулю.
+
+    Временная сложность: O(log n) умножений чисел размера m.
+    """
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m == 1:
+        return 0
+    if n < 0:
+        x, n = _mod_inverse(x, m), -n
+    return power(x % m, n, lambda a, b: a * b % m, 1 % m, window)
+
+
+def _mod_inverse(x: int, m: int) -> int:
+    """Обратный к x по модулю m расширенным алгоритмом Евклида (итеративно). O(log m)."""
+    old_r, r = x % m, m
+    old_s, s = 1, 0
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+    if old_r != 1:
+        raise ValueError("base is not invertible for this modulus")
+    return old_s % m
+
+
+def monoid_pow(x: T, n: int, mul: Callable[[T, T], T], identity: T) -> T:
+    """Возведение в степень n >= 0 в произвольном моноиде (та же идея, что в fast_pow).
+
+    mul — ассоциативная операция, identity — нейтральный элемент. Подходит
+    для матриц, чисел по модулю и т.п. Вычисляется итеративно через power.
+    Временная сложность: O(log n) умножений.
+    Пространственная сложность: O(1) без учёта окна power.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    return power(x, n, mul, identity)
+
+
 if __name__ == "__main__":
     print(PC_INFO)
     print("factorial(5) =", factorial(5))  # 120
     print("fib_naive(10) =", fib_naive(10))  # 55
     print("fast_pow(2, 10) =", fast_pow(2, 10))  # 1024
+    print("power(3, 100) =", power(3, 100))  # точное целое
+    print("pow_mod(3, 10**18, 10**9 + 7) =", pow_mod(3, 10 ** 18, 10 ** 9 + 7))
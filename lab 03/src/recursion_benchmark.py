@@ -0,0 +1,157 @@
+"""Сравнение рекурсивных и итеративных версий алгоритмов ЛР-03.
+
+Две метрики: время одного вызова на одинаковом входе (накладные расходы
+кадров стека) и наибольший вход, который версия обрабатывает без RecursionError.
+"""
+import os
+import sys
+import tempfile
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from recursion import (factorial, factorial_iterative, fast_pow, fast_pow_iterative,
+                       fib_naive, fib_naive_iterative, pow_mod, power)
+from recursion_tasks import (binary_search_iterative, hanoi_moves, hanoi_moves_iterative,
+                             max_depth_walk, max_depth_walk_iterative, recursive_binary_search)
+
+# (имя, рекурсивная, итеративная, аргументы для замера времени)
+_SORTED = list(range(0, 2_000_000, 2))
+PAIRS: List[Tuple[str, Callable, Callable, tuple]] = [
+    ("factorial(500)", factorial, factorial_iterative, (500,)),
+    ("fib_naive(20)", fib_naive, fib_naive_iterative, (20,)),
+    ("fast_pow(1.0001, 10**6)", fast_pow, fast_pow_iterative, (1.0001, 10 ** 6)),
+    ("binary_search(1e6)", lambda t: recursive_binary_search(_SORTED, t, 0, len(_SORTED) - 1),
+     lambda t: binary_search_iterative(_SORTED, t, 0, len(_SORTED) - 1), (123_456,)),
+    ("hanoi(14)", lambda n: hanoi_moves(n, "A", "B", "C"),
+     lambda n: hanoi_moves_iterative(n, "A", "B", "C"), (14,)),
+]
+
+
+def compare_call_overhead(repeat: int = 5) -> List[Tuple[str, float, float]]:
+    """Время вызова (лучшее из repeat, мс) рекурсивной и итеративной версии; проверяет равенство результатов."""
+    results = []
+    for name, rec, it, args in PAIRS:
+        if rec(*args) != it(*args):
+            raise AssertionError(f"{name}: results differ")
+        rec_ms = min(timeit.repeat(lambda: rec(*args), number=1, repeat=repeat)) * 1000
+        it_ms = min(timeit.repeat(lambda: it(*args), number=1, repeat=repeat)) * 1000
+        results.append((name, rec_ms, it_ms))
+    return results
+
+
+def _max_supported(func: Callable[[int], object], limit: int) -> Tuple[int, bool]:
+    """Наибольший n <= limit (удвоением, затем бинарным поиском), при котором func(n) не бросает RecursionError.
+
+    Возвращает (n, достигнут ли limit).
+    """
+    good, n = 0, 1
+    while n <= limit:
+        try:
+            func(n)
+        except RecursionError:
+            break
+        good, n = n, n * 2
+    else:
+        try:
+            func(limit)
+            return limit, True
+        except RecursionError:
+            n = limit
+    lo, hi = good, n  # func(lo) работает, func(hi) — нет
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        try:
+            func(mid)
+            lo = mid
+        except RecursionError:
+            hi = mid
+    return lo, False
+
+
+def _nested_dirs(depth: int) -> Tuple[str, Callable[[], None]]:
+    """Создаёт во временном каталоге цепочку из depth вложенных папок; возвращает корень и функцию удаления."""
+    root = tempfile.mkdtemp()
+    paths = [root]
+    for _ in range(depth):  # os.makedirs и shutil.rmtree сами рекурсивны и упали бы на такой глубине
+        paths.append(os.path.join(paths[-1], "d"))
+        os.mkdir(paths[-1])
+
+    def cleanup() -> None:
+        for path in reversed(paths):
+            os.rmdir(path)
+
+    return root, cleanup
+
+
+def compare_max_input(limit: int = 20_000, dir_depth: Optional[int] = None) -> Dict[str, Tuple[str, str]]:
+    """Наибольший вход без RecursionError для factorial и max_depth_walk.
+
+    Для остальных функций глубина рекурсии O(log n) или вход ограничен
+    временем O(2^n), а не стеком. dir_depth по умолчанию — чуть выше
+    предела рекурсии интерпретатора (имя папки — 1 символ, PATH_MAX не достигается).
+    """
+    def fmt(value: Tuple[int, bool]) -> str:
+        n, reached = value
+        return f">= {n}" if reached else str(n)
+
+    results = {
+        "factorial": (fmt(_max_supported(factorial, limit)),
+                      fmt(_max_supported(factorial_iterative, limit))),
+    }
+    depth = dir_depth if dir_depth is not None else sys.getrecursionlimit() + 200
+    root, cleanup = _nested_dirs(depth)
+    try:
+        try:
+            rec = str(max_depth_walk(root))
+        except RecursionError:
+            rec = "RecursionError"
+        results[f"max_depth_walk (depth {depth})"] = (rec, str(max_depth_walk_iterative(root)))
+    finally:
+        cleanup()
+    return results
+
+
+def compare_pow(repeat: int = 5) -> List[Tuple[str, str, float]]:
+    """Время (лучшее из repeat, мс) fast_pow, power и встроенного pow.
+
+    fast_pow работает с float, поэтому для 3^n он либо теряет точность,
+    либо переполняется; power и pow считают точно.
+    """
+    mod = (1 << 127) - 1
+    big_exp = (1 << 4096) - 12345
+    cases: List[Tuple[str, str, Callable[[], object]]] = [
+        ("3^1000", "fast_pow (float)", lambda: fast_pow(3, 1000)),
+        ("3^1000", "fast_pow_iterative (float)", lambda: fast_pow_iterative(3, 1000)),
+        ("3^1000", "power", lambda: power(3, 1000)),
+        ("3^1000", "pow", lambda: pow(3, 1000)),
+        ("3^100000", "power", lambda: power(3, 100_000)),
+        ("3^100000", "pow", lambda: pow(3, 100_000)),
+        ("3^(2^4096) mod p", "pow_mod window=1", lambda: pow_mod(3, big_exp, mod, window=1)),
+        ("3^(2^4096) mod p", "pow_mod sliding", lambda: pow_mod(3, big_exp, mod)),
+        ("3^(2^4096) mod p", "pow(a, n, m)", lambda: pow(3, big_exp, mod)),
+    ]
+    results = []
+    for task, name, run in cases:
+        try:
+            run()
+        except OverflowError:
+            results.append((task, name, float("nan")))
+            continue
+        elapsed = min(timeit.repeat(run, number=1, repeat=repeat)) * 1000
+        results.append((task, name, elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'call':>26} | {'recursive ms':>12} | {'iterative ms':>12}")
+    print("-" * 58)
+    for name, rec_ms, it_ms in compare_call_overhead():
+        print(f"{name:>26} | {rec_ms:12.3f} | {it_ms:12.3f}")
+    print(f"\n{'max input':>34} | {'recursive':>14} | {'iterative':>14}")
+    print("-" * 70)
+    for name, (rec, it) in compare_max_input().items():
+        print(f"{name:>34} | {rec:>14} | {it:>14}")
+    print(f"\n{'power':>18} | {'variant':>26} | {'ms':>10}")
+    print("-" * 62)
+    for task, name, ms in compare_pow():
+        print(f"{task:>18} | {name:>26} | {ms:10.3f}")
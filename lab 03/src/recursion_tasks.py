@@ -18,6 +18,23 @@ def recursive_binary_search(arr: List[int], target: int, left: int, right: int)
     return recursive_binary_search(arr, target, left, mid - 1)
 
 
+def binary_search_iterative(arr: List[int], target: int, left: int, right: int) -> Optional[int]:
+    """Итеративный аналог recursive_binary_search (те же середины и тот же результат).
+
+    Временная сложность: O(log n)
+    Пространственная сложность: O(1)
+    """
+    while left <= right:
+        mid = (left + right) // 2
+        if arr[mid] == target:
+            return mid
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    return None
+
+
 def hanoi_moves(n: int, src: str, aux: str, dst: str, moves: Optional[List[Tuple[str, str]]] = None) -> List[Tuple[str, str]]:
     """Генерирует последовательность перемещений для задачи Ханойских башен.
 
@@ -42,6 +59,27 @@ def hanoi_moves(n: int, src: str, aux: str, dst: str, moves: Optional[List[Tuple
     return moves
 
 
+def hanoi_moves_iterative(n: int, src: str, aux: str, dst: str) -> List[Tuple[str, str]]:
+    """Ханойские башни с явным стеком; порядок ходов совпадает с hanoi_moves.
+
+    В стеке лежат задачи ("перенести k дисков") и отложенные ходы; задача
+    раскладывается в обратном порядке, чтобы первой выполнилась левая ветвь.
+    Временная сложность: O(2^n), память стека O(n).
+    """
+    moves: List[Tuple[str, str]] = []
+    # (k, откуда, через, куда); k == 0 — отложенный ход самого большого диска
+    stack: List[Tuple[int, str, str, str]] = [(n, src, aux, dst)] if n > 0 else []
+    while stack:
+        k, s, a, d = stack.pop()
+        if k <= 1:
+            moves.append((s, d))
+        else:
+            stack.append((k - 1, a, s, d))
+            stack.append((0, s, a, d))
+            stack.append((k - 1, s, d, a))
+    return moves
+
+
 def walk_directory(path: str, depth: int = 0, max_depth: Optional[int] = None) -> List[str]:
     """Рекурсивный обход директории: возвращает список строк с отступами, представляющими дерево.
 
@@ -86,6 +124,29 @@ def max_depth_walk(path: str) -> int:
     return max_d
 
 
+def max_depth_walk_iterative(path: str) -> int:
+    """Итеративный аналог max_depth_walk (явный стек), без ограничения глубины рекурсии.
+
+    Недоступные каталоги, как и в рекурсивной версии, считаются пустыми.
+    Временная сложность: O(number_of_files + number_of_dirs)
+    Пространственная сложность: O(ширина * глубина) — стек путей
+    """
+    max_d = 0
+    stack: List[Tuple[str, int]] = [(path, 0)]
+    while stack:
+        current, depth = stack.pop()
+        if depth > max_d:
+            max_d = depth
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, depth + 1))
+        except (PermissionError, FileNotFoundError):
+            continue
+    return max_d
+
+
 # Примеры работы
 if __name__ == "__main__":
     # Рекурсивный бинарный поиск
@@ -0,0 +1,237 @@
+"""Бинарный поиск без рекурсии: одиночный, пакетный, векторный и индекс Эйтцингера.
+
+Все функции возвращают позицию вставки с семантикой bisect_left / bisect_right.
+Если установлен NumPy, пакетный поиск выполняется через numpy.searchsorted;
+без него используется пакетный обход со слиянием на чистом Python.
+"""
+import random
+import timeit
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен
+    np = None
+
+from recursion_tasks import recursive_binary_search
+
+
+def bisect_left(arr: Sequence, x, lo: int = 0, hi: Optional[int] = None) -> int:
+    """Первая позиция i в arr[lo:hi], где arr[i] >= x.
+
+    Временная сложность: O(log n)
+    Пространственная сложность: O(1)
+    """
+    if hi is None:
+        hi = len(arr)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def bisect_right(arr: Sequence, x, lo: int = 0, hi: Optional[int] = None) -> int:
+    """Первая позиция i в arr[lo:hi], где arr[i] > x.
+
+    Временная сложность: O(log n)
+    Пространственная сложность: O(1)
+    """
+    if hi is None:
+        hi = len(arr)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if x < arr[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def binary_search(arr: Sequence, target) -> Optional[int]:
+    """Индекс первого вхождения target или None.
+
+    В отличие от recursive_binary_search при повторах возвращается
+    самое левое вхождение. Временная сложность: O(log n).
+    """
+    i = bisect_left(arr, target)
+    return i if i < len(arr) and arr[i] == target else None
+
+
+def _gallop(arr: Sequence, x, lo: int, right: bool) -> int:
+    """bisect от позиции lo: шаги 1, 2, 4, ... вперёд, затем бинарный поиск в найденном окне.
+
+    Время O(log d), d — расстояние от lo до ответа.
+    """
+    n = len(arr)
+    step = 1
+    hi = lo
+    while hi < n and (arr[hi] <= x if right else arr[hi] < x):
+        lo = hi + 1
+        hi += step
+        step *= 2
+    hi = min(hi, n)
+    return bisect_right(arr, x, lo, hi) if right else bisect_left(arr, x, lo, hi)
+
+
+def batch_bisect(arr: Sequence, queries: Sequence, side: str = "left") -> List[int]:
+    """bisect для каждого запроса; результат в порядке queries.
+
+    Запросы сортируются и проходят по массиву вместе (как при слиянии):
+    каждый следующий поиск начинается с ответа предыдущего и идёт
+    галопом. Время O(m log m + m log(n / m)) — для m ~ n это O(n + m log m)
+    вместо O(m log n), память O(m).
+    """
+    if side not in ("left", "right"):
+        raise ValueError("side must be 'left' or 'right'")
+    right = side == "right"
+    order = sorted(range(len(queries)), key=queries.__getitem__)
+    result = [0] * len(queries)
+    pos = 0
+    for i in order:
+        pos = _gallop(arr, queries[i], pos, right)
+        result[i] = pos
+    return result
+
+
+def batch_search(arr: Sequence, queries: Sequence, side: str = "left"):
+    """Пакетный bisect: numpy.searchsorted, если есть NumPy, иначе batch_bisect.
+
+    С NumPy возвращает ndarray индексов (O(m log n) на C), без него — список.
+    """
+    if np is None:
+        return batch_bisect(arr, queries, side)
+    return np.searchsorted(np.asarray(arr), np.asarray(queries), side=side)
+
+
+def interpolation_search(arr: Sequence[float], x: float) -> int:
+    """bisect_left для чисел, распределённых примерно равномерно.
+
+    Следующая проба — линейная интерполяция между концами окна, а не
+    середина: в среднем O(log log n) проб; при неудачной интерполяции
+    окно всё равно сужается хотя бы на один элемент, поэтому на
+    неравномерных данных худший случай O(n) — тогда лучше bisect_left.
+    """
+    lo, hi = 0, len(arr)  # ответ в [lo, hi]
+    while lo < hi:
+        a, b = arr[lo], arr[hi - 1]
+        if x <= a:
+            return lo
+        if x > b:
+            return hi
+        if a == b:  # x между равными концами невозможен — сюда не попадаем
+            return lo
+        mid = lo + int((x - a) * (hi - 1 - lo) / (b - a))
+        mid = min(max(mid, lo), hi - 1)
+        if arr[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class EytzingerIndex:
+    """Отсортированный массив в порядке обхода кучи (BFS, раскладка Эйтцингера).
+
+    Узел k хранит детей в 2k и 2k+1: первые уровни дерева лежат рядом
+    и остаются в кеше, а следующий адрес известен заранее, что помогает
+    предвыборке. Для NumPy поиск пакета идёт одновременно по всем запросам:
+    log n векторных шагов вместо m отдельных поисков.
+    Построение O(n), поиск O(log n).
+    """
+
+    def __init__(self, arr: Sequence) -> None:
+        n = len(arr)
+        self._n = n
+        tree: list = [None] * (n + 1)  # 1-индексация, tree[0] не используется
+        rank = [0] * (n + 1)  # позиция в исходном отсортированном массиве
+        # Обход в симметричном порядке (явным стеком) раскладывает arr по узлам
+        i = 0
+        k = 1
+        stack: List[int] = []
+        while stack or k <= n:
+            if k <= n:
+                stack.append(k)
+                k = 2 * k
+                continue
+            k = stack.pop()
+            tree[k] = arr[i]
+            rank[k] = i
+            i += 1
+            k = 2 * k + 1
+        self._tree = tree
+        self._rank = rank
+        if np is not None and n:
+            self._np_tree = np.asarray(tree[1:])
+            self._np_rank = np.asarray(rank, dtype=np.int64)
+
+    def bisect_left(self, x) -> int:
+        """Позиция вставки x слева в исходном массиве. Время O(log n)."""
+        tree, n = self._tree, self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < x)
+        # Отбрасываем правые повороты после последнего левого: k >> (число младших единиц + 1)
+        k >>= ((~k) & (k + 1)).bit_length()
+        return self._rank[k] if k else n
+
+    def bisect_left_many(self, queries: Sequence):
+        """Пакетный bisect_left. С NumPy — векторные шаги по уровням дерева, иначе цикл."""
+        if np is None or not self._n:
+            return [self.bisect_left(q) for q in queries]
+        q = np.asarray(queries)
+        k = np.ones(len(q), dtype=np.int64)
+        n = self._n
+        tree = self._np_tree
+        for _ in range(n.bit_length()):
+            inside = k <= n
+            step = np.zeros(len(q), dtype=np.int64)
+            step[inside] = tree[k[inside] - 1] < q[inside]
+            k = np.where(inside, 2 * k + step, k)
+        # число младших единиц: k ^ (k + 1) — маска из t+1 единиц
+        shift = np.floor(np.log2((k ^ (k + 1)).astype(np.float64))).astype(np.int64) + 1
+        k >>= shift
+        return np.where(k > 0, self._np_rank[k], n)
+
+
+def compare_search(n: int = 1_000_000, m: int = 100_000, seed: int = 0) -> List[Tuple[str, float]]:
+    """Время поиска m запросов (мс) в отсортированном массиве из n чисел каждой реализацией.
+
+    Все реализации проверяются на совпадение с bisect_left.
+    """
+    rnd = random.Random(seed)
+    arr = sorted(rnd.randrange(4 * n) for _ in range(n))
+    queries = [rnd.randrange(4 * n) for _ in range(m)]
+    expected = [bisect_left(arr, q) for q in queries]
+    index = EytzingerIndex(arr)
+    candidates = {
+        "recursive_binary_search": lambda: [recursive_binary_search(arr, q, 0, n - 1) for q in queries],
+        "bisect_left (loop)": lambda: [bisect_left(arr, q) for q in queries],
+        "batch_bisect (merge)": lambda: batch_bisect(arr, queries),
+        "interpolation_search": lambda: [interpolation_search(arr, q) for q in queries],
+        "EytzingerIndex": lambda: [index.bisect_left(q) for q in queries],
+    }
+    checks = {
+        "bisect_left (loop)", "batch_bisect (merge)", "interpolation_search", "EytzingerIndex",
+    }
+    if np is not None:
+        np_arr, np_queries = np.asarray(arr), np.asarray(queries)
+        candidates["numpy.searchsorted"] = lambda: np.searchsorted(np_arr, np_queries)
+        candidates["EytzingerIndex (numpy)"] = lambda: index.bisect_left_many(np_queries)
+        checks |= {"numpy.searchsorted", "EytzingerIndex (numpy)"}
+    results = []
+    for name, run in candidates.items():
+        if name in checks and list(run()) != expected:
+            raise AssertionError(f"{name}: wrong result")
+        elapsed = min(timeit.repeat(run, number=1, repeat=3)) * 1000
+        results.append((name, elapsed))
+    return results
+
+
+if __name__ == "__main__":
+    for size in (10_000, 1_000_000):
+        print(f"n = {size}, m = 100000")
+        for name, ms in compare_search(size, 100_000):
+            print(f"{name:>26} | {ms:10.2f} ms")
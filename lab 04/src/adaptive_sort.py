@@ -0,0 +1,183 @@
+"""Адаптивная сортировка: выбор алгоритма по дешёвой выборке из входа.
+
+Признаки считаются по O(SAMPLE_SIZE) элементам (плюс min/max за один проход
+для целых), после чего вход передаётся одному из алгоритмов sorts.py.
+Пороги можно откалибровать по CSV, который пишет performance_test.py.
+"""
+import csv
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from array_sorts import COUNTING_RANGE_FACTOR, integer_sort
+from sorts import insertion_sort, intro_sort, natural_merge_sort
+
+SAMPLE_SIZE: int = 256
+# integer_sort работает с int64 (NumPy / array('q'))
+INT64_MIN: int = -2 ** 63
+INT64_MAX: int = 2 ** 63 - 1
+
+
+@dataclass
+class Thresholds:
+    """Пороги выбора алгоритма."""
+
+    insertion_max: int = 32  # до этого размера — сортировка вставками
+    presorted_ratio: float = 0.2  # доля "сбоев" порядка, ниже которой — natural merge
+    inversions_ratio: float = 0.05  # доля инверсий, ниже которой (или выше 1 - её) — natural merge
+    counting_range_factor: int = COUNTING_RANGE_FACTOR  # диапазон <= n * factor — counting sort
+    duplicates_ratio: float = 0.5  # доля повторов, начиная с которой — distinct_sort
+    use_counting: bool = True
+    use_natural: bool = True
+
+
+@dataclass
+class SortDecision:
+    """Принятое решение: алгоритм, причина и признаки, по которым оно принято."""
+
+    algorithm: str
+    reason: str
+    features: Dict[str, float] = field(default_factory=dict)
+
+
+DEFAULT_THRESHOLDS = Thresholds()
+
+
+def sample_features(a: List, sample_size: int = SAMPLE_SIZE) -> Dict[str, float]:
+    """Оценивает признаки входа по выборке.
+
+    descents — доля соседних пар с a[i] > a[i+1] (мера числа серий),
+    ascents — то же для a[i] < a[i+1] (близость к обратному порядку),
+    inversions — доля инверсий среди случайных пар i < j,
+    duplicates — доля повторов в выборке,
+    scalar — 1.0, если все значения выборки одного типа int / float / str,
+    span — max - min; только если весь вход (а не выборка) состоит из int
+    в диапазоне int64, иначе integer_sort исказил бы или не принял значения.
+    Время: O(sample_size) + O(n) на min/max для целых.
+    """
+    n = len(a)
+    rnd = random.Random(n)
+    positions = [rnd.randrange(n - 1) for _ in range(sample_size)] if n > 1 else []
+    descents = sum(1 for i in positions if a[i] > a[i + 1])
+    ascents = sum(1 for i in positions if a[i] < a[i + 1])
+    pairs = [sorted(rnd.sample(range(n), 2)) for _ in range(sample_size)] if n > 1 else []
+    inversions = sum(1 for i, j in pairs if a[i] > a[j])
+    values = [a[rnd.randrange(n)] for _ in range(sample_size)] if n else []
+    features: Dict[str, float] = {
+        "n": n,
+        "descents": descents / len(positions) if positions else 0.0,
+        "ascents": ascents / len(positions) if positions else 0.0,
+        "inversions": inversions / len(pairs) if pairs else 0.0,
+        "duplicates": 1 - len(set(values)) / len(values) if values else 0.0,
+        "scalar": float(len({type(v) for v in values}) == 1 and type(values[0]) in (int, float, str)),
+    }
+    if values and all(type(v) is int for v in values) and all(type(v) is int for v in a):
+        lo, hi = min(a), max(a)
+        if INT64_MIN <= lo and hi <= INT64_MAX:
+            features["span"] = hi - lo
+    return features
+
+
+def choose_sort(a: List, thresholds: Thresholds = DEFAULT_THRESHOLDS) -> SortDecision:
+    """Выбирает алгоритм для a и возвращает решение с признаками."""
+    n = len(a)
+    if n <= thresholds.insertion_max:
+        return SortDecision("insertion_sort", f"n={n} <= {thresholds.insertion_max}", {"n": n})
+    features = sample_features(a)
+    # Мало серий (descents/ascents) или мало инверсий (элементы смещены недалеко —
+    # короткие серии natural merge досортирует вставками) — почти упорядоченный вход.
+    nearly_sorted = (features["descents"] <= thresholds.presorted_ratio
+                     or features["inversions"] <= thresholds.inversions_ratio)
+    nearly_reversed = (features["ascents"] <= thresholds.presorted_ratio
+                       or features["inversions"] >= 1 - thresholds.inversions_ratio)
+    if thresholds.use_natural and (nearly_sorted or nearly_reversed):
+        return SortDecision("natural_merge_sort", "input is nearly sorted or nearly reversed", features)
+    span = features.get("span")
+    if thresholds.use_counting and span is not None and span <= n * thresholds.counting_range_factor:
+        return SortDecision("integer_sort", f"integer span {span} <= n * {thresholds.counting_range_factor}",
+                            features)
+    if features["scalar"] and features["duplicates"] >= thresholds.duplicates_ratio:
+        return SortDecision("distinct_sort", f"duplicates {features['duplicates']:.2f} >= "
+                                             f"{thresholds.duplicates_ratio}: sort distinct keys", features)
+    return SortDecision("intro_sort", "general input", features)
+
+
+def distinct_sort(a: List) -> List:
+    """Сортировка через подсчёт: сортируются только различные значения, затем разворачиваются.
+
+    Только для значений, у которых равные неотличимы (int, float, str одного типа).
+    Время: O(n + u log u), u — число различных значений; память O(u).
+    """
+    counts = Counter(a)
+    result: List = []
+    for value in sorted(counts):
+        result.extend([value] * counts[value])
+    return result
+
+
+_DISPATCH = {
+    "insertion_sort": insertion_sort,
+    "natural_merge_sort": natural_merge_sort,
+    "integer_sort": integer_sort,
+    "intro_sort": intro_sort,
+    "distinct_sort": distinct_sort,
+}
+
+
+def adaptive_sort_with_decision(a: List, thresholds: Thresholds = DEFAULT_THRESHOLDS) -> Tuple[List, SortDecision]:
+    """Сортирует a выбранным алгоритмом и возвращает (результат, решение)."""
+    decision = choose_sort(a, thresholds)
+    return _DISPATCH[decision.algorithm](a), decision
+
+
+def adaptive_sort(a: List, thresholds: Thresholds = DEFAULT_THRESHOLDS) -> List:
+    """Adaptive Sort: вставки / natural merge / counting-radix / подсчёт различных / introsort по признакам входа.
+
+    Best: O(n) (почти упорядоченный вход или узкий диапазон целых)
+    Worst: O(n log n)
+    """
+    return adaptive_sort_with_decision(a, thresholds)[0]
+
+
+def calibrate(csv_file: str = "lab04_results.csv") -> Thresholds:
+    """Подбирает пороги по результатам performance_test.py (медианное время).
+
+    insertion_max — наибольший размер, на котором insertion_sort быстрее intro_sort
+    на случайных данных; counting / natural merge включаются, если они быстрее
+    intro_sort на наибольшем измеренном размере для 'random' / 'almost_sorted'.
+    """
+    times: Dict[Tuple[str, int, str], float] = {}
+    with open(csv_file, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            times[(row["algorithm"], int(row["size"]), row["data_type"])] = float(
+                row.get("median_ms") or row["time_ms"])
+
+    def faster(alg: str, data_type: str) -> Optional[bool]:
+        sizes = [n for (a, n, t) in times if a == alg and t == data_type and (("intro_sort", n, t) in times)]
+        if not sizes:
+            return None
+        n = max(sizes)
+        return times[(alg, n, data_type)] < times[("intro_sort", n, data_type)]
+
+    thresholds = Thresholds()
+    wins = [n for (a, n, t) in times
+            if a == "insertion_sort" and t == "random" and ("intro_sort", n, t) in times
+            and times[(a, n, t)] < times[("intro_sort", n, t)]]
+    if wins:
+        thresholds.insertion_max = max(wins)
+    for attr, alg, data_type in (("use_counting", "counting_sort", "random"),
+                                 ("use_natural", "natural_merge_sort", "almost_sorted")):
+        verdict = faster(alg, data_type)
+        if verdict is not None:
+            setattr(thresholds, attr, verdict)
+    return thresholds
+
+
+if __name__ == "__main__":
+    from generate_data import generate_data
+
+    for dtype in ["random", "sorted", "reversed", "almost_sorted"]:
+        data = generate_data(10000, dtype)
+        out, decision = adaptive_sort_with_decision(data)
+        print(f"{dtype:13} -> {decision.algorithm:18} ({decision.reason}); sorted={out == sorted(data)}")
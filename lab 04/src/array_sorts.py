@@ -0,0 +1,176 @@
+"""Сортировки целочисленных массивов (numpy.ndarray / array('q') / list).
+
+Если установлен NumPy, основная работа выполняется векторно; без него
+(или если значения списка не помещаются в int64) используются чистые
+Python-реализации тех же алгоритмов.
+Результат возвращается в том же виде, что и вход.
+"""
+from array import array
+from typing import List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен
+    np = None
+
+IntArray = Union[List[int], "array[int]", "np.ndarray"]
+
+# Разрядность одного прохода LSD radix sort
+RADIX_BITS: int = 16
+# Counting sort применяется, если диапазон значений не больше n * COUNTING_RANGE_FACTOR
+COUNTING_RANGE_FACTOR: int = 16
+
+
+def _to_numpy(a: Sequence[int]) -> Optional["np.ndarray"]:
+    """Приводит вход к int64 ndarray; для ndarray и array('q') без копирования.
+
+    None — NumPy не установлен или в списке есть числа вне int64:
+    тогда вызывающий идёт по ветке на чистом Python.
+    """
+    if np is None:
+        return None
+    try:
+        return np.asarray(a, dtype=np.int64)
+    except OverflowError:
+        return None
+
+
+def _restore(result: Sequence[int], like: IntArray) -> IntArray:
+    """Возвращает result в том же виде, что и исходный like."""
+    if np is not None and isinstance(like, np.ndarray):
+        return result if isinstance(result, np.ndarray) else np.asarray(result, dtype=np.int64)
+    if isinstance(like, array):
+        return array("q", result.tobytes()) if np is not None and isinstance(result, np.ndarray) else array("q", result)
+    return result.tolist() if np is not None and isinstance(result, np.ndarray) else list(result)
+
+
+def counting_sort(a: IntArray) -> IntArray:
+    """Counting Sort (сортировка подсчётом) для ограниченного диапазона значений.
+
+    Время: O(n + k), k = max - min + 1
+    Память: O(k) для счётчиков
+    Устойчивость: не требуется (сортируются сами числа)
+    Если k > n * COUNTING_RANGE_FACTOR, массив счётчиков был бы слишком
+    велик — тогда сортировка передаётся radix_sort.
+    """
+    if len(a) <= 1:
+        return _restore(list(a), a)
+    x = _to_numpy(a)
+    if x is not None:
+        lo, hi = int(x.min()), int(x.max())
+    else:
+        lo, hi = min(a), max(a)
+    if hi - lo > len(a) * COUNTING_RANGE_FACTOR:
+        return radix_sort(a)
+    if x is not None:
+        counts = np.bincount(x - lo)
+        return _restore(np.repeat(np.arange(lo, lo + len(counts), dtype=np.int64), counts), a)
+    counts = [0] * (hi - lo + 1)
+    for v in a:  # O(n)
+        counts[v - lo] += 1
+    res: List[int] = []
+    for offset, c in enumerate(counts):  # O(k)
+        if c:
+            res.extend([lo + offset] * c)
+    return _restore(res, a)
+
+
+def radix_sort(a: IntArray) -> IntArray:
+    """LSD Radix Sort по RADIX_BITS-битным разрядам.
+
+    Отрицательные числа сдвигаются на минимум, поэтому сортируются ключи >= 0.
+    Время: O(n * w / RADIX_BITS), w — разрядность (max - min)
+    Память: O(n + 2^RADIX_BITS)
+    Устойчивость: устойчива
+    """
+    if len(a) <= 1:
+        return _restore(list(a), a)
+    mask = (1 << RADIX_BITS) - 1
+    x = _to_numpy(a)
+    if x is not None:
+        lo = int(x.min())
+        keys = (x - lo).astype(np.uint64)
+        span = int(keys.max())
+        shift = 0
+        while span >> shift:
+            # устойчивая сортировка по одному разряду (в NumPy — тот же radix)
+            digit = ((keys >> np.uint64(shift)) & np.uint64(mask)).astype(np.uint16)
+            keys = keys[np.argsort(digit, kind="stable")]
+            shift += RADIX_BITS
+        return _restore((keys.astype(np.int64) + lo), a)
+    lo = min(a)
+    keys = [v - lo for v in a]
+    span = max(keys)
+    shift = 0
+    while span >> shift:
+        buckets: List[List[int]] = [[] for _ in range(mask + 1)]
+        for k in keys:  # O(n)
+            buckets[(k >> shift) & mask].append(k)
+        keys = [k for bucket in buckets for k in bucket]
+        shift += RADIX_BITS
+    return _restore([k + lo for k in keys], a)
+
+
+def bitonic_sort(a: IntArray) -> IntArray:
+    """Bitonic Sort — сортирующая сеть, все сравнения одного этапа выполняются векторно.
+
+    Длина дополняется до степени двойки максимальным значением int64.
+    Время: O(n log^2 n) сравнений, O(log^2 n) векторных этапов
+    Память: O(n)
+    Устойчивость: неустойчива
+    """
+    n = len(a)
+    if n <= 1:
+        return _restore(list(a), a)
+    size = 1 << (n - 1).bit_length()
+    values = _to_numpy(a)
+    if values is not None:
+        buf = np.full(size, np.iinfo(np.int64).max, dtype=np.int64)
+        buf[:n] = values
+        idx = np.arange(size)
+        k = 2
+        while k <= size:
+            j = k // 2
+            while j > 0:
+                partner = idx ^ j
+                left = idx[partner > idx]
+                right = left ^ j
+                x, y = buf[left], buf[right]
+                ascending = (left & k) == 0
+                swap = np.where(ascending, x > y, x < y)
+                buf[left[swap]] = y[swap]
+                buf[right[swap]] = x[swap]
+                j //= 2
+            k *= 2
+        return _restore(buf[:n], a)
+    buf_list = list(a) + [max(a)] * (size - n)
+    k = 2
+    while k <= size:
+        j = k // 2
+        while j > 0:
+            for i in range(size):
+                p = i ^ j
+                if p > i:
+                    ascending = (i & k) == 0
+                    if (buf_list[i] > buf_list[p]) == ascending:
+                        buf_list[i], buf_list[p] = buf_list[p], buf_list[i]
+            j //= 2
+        k *= 2
+    return _restore(buf_list[:n], a)
+
+
+def integer_sort(a: IntArray) -> IntArray:
+    """Выбирает counting sort для узкого диапазона значений, иначе radix sort.
+
+    Диапазон generate_data ('random' -> 0..size*10) попадает в counting sort.
+    """
+    if len(a) <= 1:
+        return _restore(list(a), a)
+    x = _to_numpy(a)
+    if x is not None:
+        span = int(x.max()) - int(x.min())
+    else:
+        span = max(a) - min(a)
+    if span <= len(a) * COUNTING_RANGE_FACTOR:
+        return counting_sort(a)
+    return radix_sort(a)
@@ -0,0 +1,168 @@
+"""Внешняя (out-of-core) сортировка слиянием для файлов больше оперативной памяти.
+
+1. Файл читается кусками, размер которых задаётся бюджетом памяти;
+   каждый кусок сортируется в памяти и пишется во временный файл-серию.
+2. Серии сливаются k-путевым слиянием на куче (heapq.merge) группами
+   не больше fan_in, пока не останется одна серия.
+
+Серии хранятся как int64 в машинном порядке байт и читаются через mmap
+блоками, поэтому в памяти одновременно находится O(fan_in * block) чисел.
+"""
+import heapq
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from typing import Callable, Iterator, List, Optional
+
+from sorts import merge_sort_bottom_up
+
+# Оценка памяти на один элемент при сортировке списка: объект int + ссылка + буфер слияния
+BYTES_PER_ITEM: int = 64
+DEFAULT_MEMORY_BYTES: int = 256 * 1024 * 1024
+DEFAULT_FAN_IN: int = 64
+# Сколько чисел читается/пишется за одно обращение к файлу
+IO_BLOCK: int = 1 << 16
+# Сколько символов CSV читается за одно обращение (строка может быть любой длины)
+CSV_BLOCK_CHARS: int = 1 << 20
+
+
+def _read_chunks(path: str, fmt: str, chunk_items: int) -> Iterator[List[int]]:
+    """Читает входной файл кусками не больше chunk_items чисел.
+
+    CSV читается блоками фиксированной длины, а не строками: файл из одной
+    огромной строки тоже не загружается целиком. Число, разрезанное
+    границей блока, переносится в следующий блок.
+    """
+    if fmt == "bin":
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(chunk_items * 8)
+                if not data:
+                    return
+                yield array("q", data).tolist()
+    elif fmt == "csv":
+        block = min(CSV_BLOCK_CHARS, max(chunk_items, 1) * 8)  # ~8 символов на число
+        with open(path, "r", encoding="utf-8") as f:
+            chunk: List[int] = []
+            tail = ""
+            while True:
+                text = f.read(block)
+                if not text:
+                    break
+                tokens = (tail + text).replace(",", " ").split()
+                tail = ""
+                if not (text[-1].isspace() or text[-1] == ","):
+                    tail = tokens.pop()  # число может продолжаться в следующем блоке
+                chunk.extend(map(int, tokens))
+                start = 0
+                while len(chunk) - start >= chunk_items:
+                    yield chunk[start:start + chunk_items]
+                    start += chunk_items
+                if start:
+                    chunk = chunk[start:]
+            if tail:
+                chunk.append(int(tail))
+            if chunk:
+                yield chunk
+    else:
+        raise ValueError(f"Unknown fmt: {fmt}")
+
+
+def _read_run(path: str, block: int = IO_BLOCK) -> Iterator[int]:
+    """Последовательно читает серию int64 через mmap, блоками по block чисел."""
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm).cast("q")
+        try:
+            for lo in range(0, len(view), block):
+                yield from view[lo:lo + block].tolist()
+        finally:
+            view.release()
+
+
+def _write_run(values, f, fmt: str = "bin", block: int = IO_BLOCK) -> None:
+    """Буферизованная запись последовательности чисел блоками по block элементов."""
+    buf = array("q")
+    for v in values:
+        buf.append(v)
+        if len(buf) >= block:
+            _flush(buf, f, fmt)
+            buf = array("q")
+    if buf:
+        _flush(buf, f, fmt)
+
+
+def _flush(buf: "array[int]", f, fmt: str) -> None:
+    """Записывает накопленный блок в файл в формате fmt."""
+    if fmt == "bin":
+        buf.tofile(f)
+    else:
+        f.write("\n".join(map(str, buf)))
+        f.write("\n")
+
+
+def external_sort(src: str, dst: str, fmt: str = "bin",
+                  memory_bytes: int = DEFAULT_MEMORY_BYTES, fan_in: int = DEFAULT_FAN_IN,
+                  sort_func: Callable[[List[int]], List[int]] = merge_sort_bottom_up,
+                  tmp_dir: Optional[str] = None) -> int:
+    """Сортирует числа из файла src и пишет результат в dst в том же формате.
+
+    fmt: 'bin' (int64) или 'csv' (числа через перевод строки / запятую).
+    memory_bytes: бюджет памяти на сортировку одного куска.
+    fan_in: сколько серий сливается за один проход.
+    Возвращает количество отсортированных чисел.
+
+    Время: O(n log n) сравнений, O(n * log_{fan_in}(n / chunk)) ввода-вывода
+    Память: O(memory_bytes)
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be >= 2")
+    chunk_items = max(1, memory_bytes // BYTES_PER_ITEM)
+    work_dir = tempfile.mkdtemp(prefix="extsort_", dir=tmp_dir)
+    try:
+        runs: List[str] = []
+        total = 0
+        for chunk in _read_chunks(src, fmt, chunk_items):
+            run_path = os.path.join(work_dir, f"run_{len(runs)}.bin")
+            with open(run_path, "wb") as f:
+                _write_run(sort_func(chunk), f)
+            runs.append(run_path)
+            total += len(chunk)
+
+        generation = 0
+        while len(runs) > fan_in:
+            merged: List[str] = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                run_path = os.path.join(work_dir, f"merge_{generation}_{len(merged)}.bin")
+                with open(run_path, "wb") as f:
+                    _write_run(heapq.merge(*(_read_run(p) for p in group)), f)
+                for p in group:
+                    os.remove(p)
+                merged.append(run_path)
+            runs = merged
+            generation += 1
+
+        with open(dst, "wb" if fmt == "bin" else "w") as f:
+            _write_run(heapq.merge(*(_read_run(p) for p in runs)), f, fmt)
+        return total
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    from generate_data import generate_data_to_file
+
+    work = tempfile.mkdtemp()
+    src_path = os.path.join(work, "input.bin")
+    dst_path = os.path.join(work, "output.bin")
+    generate_data_to_file(src_path, 1_000_000, "random")
+    count = external_sort(src_path, dst_path, memory_bytes=8 * 1024 * 1024, fan_in=8)
+    out = array("q")
+    with open(dst_path, "rb") as fh:
+        out.frombytes(fh.read())
+    print(f"sorted {count} numbers:", all(out[i] <= out[i + 1] for i in range(len(out) - 1)))
+    shutil.rmtree(work)
@@ -1,4 +1,5 @@
 import random
+from array import array
 from typing import List
 
 
@@ -27,3 +28,48 @@ def generate_data(size: int, data_type: str = "random", almost_fraction: float =
             arr[i], arr[j] = arr[j], arr[i]
         return arr
     raise ValueError(f"Unknown data_type: {data_type}")
+
+
+# Сколько чисел генерируется и записывается за один шаг потокового режима
+STREAM_CHUNK: int = 1 << 20
+
+
+def _stream_chunks(size: int, data_type: str, almost_fraction: float, chunk: int):
+    """Выдаёт данные generate_data кусками по chunk элементов (без всего списка в памяти)."""
+    for lo in range(0, size, chunk):
+        hi = min(lo + chunk, size)
+        if data_type == "random":
+            yield [random.randint(0, size * 10) for _ in range(hi - lo)]
+        elif data_type == "sorted":
+            yield list(range(lo, hi))
+        elif data_type == "reversed":
+            yield list(range(size - 1 - lo, size - 1 - hi, -1))
+        elif data_type == "almost_sorted":
+            # перестановки делаются внутри куска, а не по всему массиву
+            block = list(range(lo, hi))
+            for _ in range(max(1, int((hi - lo) * (1 - almost_fraction)))):
+                i = random.randrange(hi - lo)
+                j = random.randrange(hi - lo)
+                block[i], block[j] = block[j], block[i]
+            yield block
+        else:
+            raise ValueError(f"Unknown data_type: {data_type}")
+
+
+def generate_data_to_file(path: str, size: int, data_type: str = "random", fmt: str = "bin",
+                          almost_fraction: float = 0.95, chunk: int = STREAM_CHUNK) -> None:
+    """Потоковый режим generate_data: пишет size чисел прямо в файл.
+
+    fmt: 'bin' — int64 в машинном порядке байт, 'csv' — одно число в строке.
+    Память: O(chunk), независимо от size.
+    """
+    if fmt not in ("bin", "csv"):
+        raise ValueError(f"Unknown fmt: {fmt}")
+    mode = "wb" if fmt == "bin" else "w"
+    with open(path, mode) as f:
+        for block in _stream_chunks(max(0, size), data_type, almost_fraction, chunk):
+            if fmt == "bin":
+                array("q", block).tofile(f)
+            else:
+                f.write("\n".join(map(str, block)))
+                f.write("\n")
@@ -0,0 +1,111 @@
+"""Инструментирование сортировок: пиковая память и счётчики операций."""
+import tracemalloc
+from typing import Dict, List, Optional
+
+from array_sorts import bitonic_sort, counting_sort, integer_sort, radix_sort
+from sorts import merge_sort, merge_sort_bottom_up, natural_merge_sort, quick_sort
+
+# Сортировки, работающие с самими целыми числами (int(x), numpy): обёртки
+# CountingKey им передать нельзя, поэтому счётчики для них не снимаются.
+NON_COMPARISON_SORTS = frozenset({counting_sort, radix_sort, bitonic_sort, integer_sort})
+# Сортировки, пишущие (целиком или частично) в собственные списки-буферы:
+# CountingList видит не все их записи, поэтому writes для них не снимается.
+UNTRACKED_WRITE_SORTS = frozenset({merge_sort, quick_sort, merge_sort_bottom_up, natural_merge_sort})
+
+
+class CountingKey:
+    """Обёртка над значением, считающая сравнения в общем счётчике counter[0]."""
+
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter: List[int]) -> None:
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other: "CountingKey") -> bool:
+        self.counter[0] += 1
+        return self.value < other.value
+
+    def __le__(self, other: "CountingKey") -> bool:
+        self.counter[0] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "CountingKey") -> bool:
+        self.counter[0] += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "CountingKey") -> bool:
+        self.counter[0] += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: object) -> bool:
+        self.counter[0] += 1
+        return isinstance(other, CountingKey) and self.value == other.value
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+
+class CountingList(list):
+    """Список, считающий записи элементов (обмен двух элементов = 2 записи).
+
+    copy() и срезы возвращают CountingList с тем же счётчиком, поэтому
+    учитываются записи в копии входа. Записи в списки, которые алгоритм
+    создаёт сам (буферы слияния, списковые включения), не видны.
+    """
+
+    def __init__(self, items=(), counter: Optional[List[int]] = None) -> None:
+        super().__init__(items)
+        self.counter = counter if counter is not None else [0]
+
+    def __setitem__(self, index, value) -> None:
+        self.counter[0] += len(value) if isinstance(index, slice) else 1
+        super().__setitem__(index, value)
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        return CountingList(item, self.counter) if isinstance(index, slice) else item
+
+    def copy(self) -> "CountingList":
+        return CountingList(self, self.counter)
+
+
+def measure_sort_memory(func, data: List[int]) -> Dict[str, float]:
+    """Пиковая и итоговая (остающаяся после вызова) память func(data) по tracemalloc, КБ.
+
+    Копия входа создаётся до начала трассировки и в результат не входит.
+    tracemalloc отслеживает только живые блоки, поэтому вместо суммарного
+    объёма всех выделений отдаётся пик — максимум одновременно занятой памяти.
+    """
+    inp = data.copy()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        out = func(inp)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del out
+    return {"peak_kb": (peak - base) / 1024, "net_kb": (current - base) / 1024}
+
+
+def count_operations(func, data: List[int]) -> Dict[str, Optional[int]]:
+    """Считает сравнения (через CountingKey) и записи элементов (через CountingList).
+
+    Для сортировок из NON_COMPARISON_SORTS (counting/radix/bitonic на числах)
+    сравнения обёрток невозможны — тогда счётчики равны None. Для
+    UNTRACKED_WRITE_SORTS writes равно None: их записи в буферы не видны.
+    Ошибки остальных сортировок не перехватываются.
+    """
+    if func in NON_COMPARISON_SORTS:
+        return {"comparisons": None, "writes": None}
+    comparisons = [0]
+    writes = [0]
+    wrapped = CountingList((CountingKey(v, comparisons) for v in data), writes)
+    writes[0] = 0
+    func(wrapped)
+    return {"comparisons": comparisons[0],
+            "writes": None if func in UNTRACKED_WRITE_SORTS else writes[0]}
@@ -0,0 +1,74 @@
+"""Параллельная сортировка на нескольких процессах.
+
+Входные данные один раз копируются в разделяемую память
+(multiprocessing.shared_memory) как массив int64, поэтому процессам
+передаётся только имя сегмента и границы куска, а не весь список.
+"""
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+from sorts import intro_sort_inplace
+
+# Меньше этого размера накладные расходы на процессы не окупаются
+PARALLEL_THRESHOLD: int = 50_000
+
+
+def _sort_chunk(shm_name: str, lo: int, hi: int) -> None:
+    """Сортирует кусок [lo:hi) массива int64 в разделяемой памяти на месте."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf.cast("q")
+    try:
+        chunk = view[lo:hi].tolist()  # O(k)
+        intro_sort_inplace(chunk)  # O(k log k)
+        view[lo:hi] = array("q", chunk)  # O(k)
+    finally:
+        view.release()
+        shm.close()
+
+
+def parallel_sort(data: List[int], workers: Optional[int] = None,
+                  threshold: int = PARALLEL_THRESHOLD) -> List[int]:
+    """Сортирует список целых (int64) на workers процессах.
+
+    Массив делится на workers кусков, каждый сортируется в своём процессе,
+    затем родитель сливает отсортированные куски k-путевым слиянием на куче.
+
+    Время: O((n/p) log(n/p)) на процессах + O(n log p) на слияние
+    Память: O(n) разделяемого буфера + O(n) результат
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(data)
+    # n < workers (в т.ч. n == 0): кусков меньше, чем процессов, а SharedMemory(size=0) недопустим
+    if workers <= 1 or n < threshold or n < workers:
+        arr = data.copy()
+        intro_sort_inplace(arr)
+        return arr
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    view = shm.buf.cast("q")
+    try:
+        view[:n] = array("q", data)  # сегмент может быть округлён вверх до страницы
+        step = (n + workers - 1) // workers
+        bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_sort_chunk, shm.name, lo, hi) for lo, hi in bounds]
+            for fut in futures:
+                fut.result()
+        chunks = [view[lo:hi].tolist() for lo, hi in bounds]
+    finally:
+        view.release()
+        shm.close()
+        shm.unlink()
+    return list(heapq.merge(*chunks))  # O(n log p)
+
+
+if __name__ == "__main__":
+    import random
+
+    sample = [random.randint(0, 10**6) for _ in range(200_000)]
+    result = parallel_sort(sample, workers=4)
+    print("sorted:", result == sorted(sample))
@@ -1,48 +1,286 @@
 import timeit
-import copy
 import csv
-from typing import List
+import math
+import multiprocessing
+import os
+import queue
+import random
+import statistics
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 
-from sorts import SORT_FUNCTIONS, is_sorted, PC_INFO
+from sorts import SORT_FUNCTIONS, intro_sort, is_sorted, PC_INFO
 from generate_data import generate_data
+from parallel_sort import parallel_sort
+from instrumentation import count_operations, measure_sort_memory
+from selection import nth_element, partial_sort, top_k
+
+# Ячейка не запускается, если прогноз её медианного времени больше бюджета
+TIME_BUDGET_MS: float = 2000.0
+CSV_FIELDS = ["algorithm", "size", "data_type", "time_ms", "min_ms", "median_ms", "stdev_ms", "runs",
+              "peak_kb", "net_kb", "comparisons", "writes"]
+
+
+def measure_sort_stats(func, data: List[int], runs: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Замеряет func(data) runs раз и возвращает min / median / mean / stdev в мс.
+
+    Копия входа готовится в setup, т.е. вне замеряемого участка; перед
+    замерами выполняется warmup прогретых запусков. Корректность проверяется
+    на том же результате, который вернул последний замеренный запуск.
+    """
+    state: Dict[str, List[int]] = {}
+
+    def setup() -> None:
+        state["input"] = data.copy()
+
+    def stmt() -> None:
+        state["output"] = func(state["input"])
+
+    for _ in range(warmup):
+        setup()
+        stmt()
+    times = [t * 1000.0 for t in timeit.repeat(stmt, setup=setup, repeat=max(1, runs), number=1)]
+    out = state["output"]
+    if len(out) != len(data) or not is_sorted(out):
+        raise AssertionError(f"{getattr(func, '__name__', func)} failed correctness for n={len(data)}")
+    return {
+        "min_ms": min(times),
+        "median_ms": statistics.median(times),
+        "mean_ms": statistics.fmean(times),
+        "stdev_ms": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "runs": len(times),
+    }
 
 
 def measure_sort_time(func, data: List[int], runs: int = 3) -> float:
-    """Возвращает среднее время в миллисекундах для func(copy(data))."""
-    stmt = lambda: func(copy.deepcopy(data))
-    total = timeit.timeit(stmt, number=runs)
-    return (total / runs) * 1000.0
+    """Возвращает медианное время func(data) в миллисекундах (см. measure_sort_stats)."""
+    return measure_sort_stats(func, data, runs=runs)["median_ms"]
 
 
-def run_experiments(sizes: List[int], data_types: List[str], runs: int = 3, csv_file: str = "lab04_results.csv"):
-    results = []
+def _pin_worker(cpu_queue) -> None:
+    """Инициализатор воркера: закрепляет процесс за одним ядром (где это поддерживается)."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        os.sched_setaffinity(0, {cpu_queue.get_nowait()})
+    except (queue.Empty, OSError):
+        pass
+
+
+def _run_cell(name: str, n: int, data_type: str, runs: int, profile: bool = False) -> Dict[str, float]:
+    """Замер одной ячейки матрицы (алгоритм, размер, тип данных) в процессе-воркере.
+
+    profile=True дополнительно (вне замеров времени) снимает память и счётчики операций.
+    """
+    # одинаковые данные для всех алгоритмов в ячейке (n, data_type)
+    random.seed(f"{data_type}-{n}")
+    data = generate_data(n, data_type)
+    func = SORT_FUNCTIONS[name]
+    stats = measure_sort_stats(func, data, runs=runs)
+    if profile:
+        stats.update(measure_sort_memory(func, data))
+        stats.update(count_operations(func, data))
+    return stats
+
+
+def _csv_row(name: str, n: int, data_type: str, stats: Dict) -> List:
+    """Строка CSV в порядке CSV_FIELDS; отсутствующие метрики остаются пустыми."""
+    def fmt(key: str) -> str:
+        value = stats.get(key)
+        if value is None:
+            return ""
+        return f"{value:.6f}" if isinstance(value, float) else str(value)
+
+    return [name, n, data_type, fmt("median_ms"), fmt("min_ms"), fmt("median_ms"), fmt("stdev_ms"),
+            fmt("runs"), fmt("peak_kb"), fmt("net_kb"), fmt("comparisons"), fmt("writes")]
+
+
+def _row_done(row: Dict[str, str], profile: bool = False) -> bool:
+    """Считается ли строка CSV готовым замером: нужны колонки статистики текущей схемы,
+    а при profile=True — ещё и колонки памяти."""
+    return bool(row.get("median_ms")) and (not profile or bool(row.get("peak_kb")))
+
+
+def _row_stats(row: Dict[str, str]) -> Dict[str, float]:
+    """Статистика ячейки из строки CSV."""
+    stats = {
+        "min_ms": float(row["min_ms"]),
+        "median_ms": float(row["median_ms"]),
+        "stdev_ms": float(row.get("stdev_ms") or 0.0),
+        "runs": int(row.get("runs") or 1),
+    }
+    for key, cast in (("peak_kb", float), ("net_kb", float), ("comparisons", int), ("writes", int)):
+        if row.get(key):
+            stats[key] = cast(row[key])
+    return stats
+
+
+def _load_done(csv_file: str, profile: bool = False) -> Dict[Tuple[str, int, str], Dict[str, float]]:
+    """Готовит CSV к дозаписи и возвращает уже записанные ячейки (для продолжения прерванного запуска).
+
+    Если заголовок файла не совпадает с CSV_FIELDS (старая схема) или в нём
+    есть строки без нужных колонок (при profile=True — без peak_kb), исходный файл сохраняется как
+    csv_file + ".bak", а csv_file переписывается с текущим заголовком и
+    только готовыми строками — остальные ячейки будут замерены заново.
+    """
+    done: Dict[Tuple[str, int, str], Dict[str, float]] = {}
+    if not os.path.exists(csv_file) or os.path.getsize(csv_file) == 0:
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(CSV_FIELDS)
+        return done
+    with open(csv_file, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        header = reader.fieldnames
+    keep = [row for row in rows if header == CSV_FIELDS and None not in row and _row_done(row, profile)]
+    if header != CSV_FIELDS or len(keep) != len(rows):
+        backup = csv_file + ".bak"
+        os.replace(csv_file, backup)
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(keep)
+        print(f"{csv_file}: header or rows do not match the current format, "
+              f"kept {len(keep)} of {len(rows)} rows (original saved to {backup})")
+    for row in keep:
+        done[(row["algorithm"], int(row["size"]), row["data_type"])] = _row_stats(row)
+    return done
+
+
+def _predict_ms(history: List[Tuple[int, float]], n: int) -> float:
+    """Экстраполирует время на размер n по последним двум замерам (степенной закон).
+
+    По одному замеру показатель степени берётся равным 2 (худший случай для лабораторных сортировок).
+    """
+    n1, t1 = history[-1]
+    exponent = 2.0
+    if len(history) >= 2:
+        n0, t0 = history[-2]
+        if t0 > 0 and t1 > 0 and n1 != n0:
+            exponent = max(1.0, math.log(t1 / t0) / math.log(n1 / n0))
+    return t1 * (n / n1) ** exponent
+
+
+def run_experiments(sizes: List[int], data_types: List[str], runs: int = 5,
+                    csv_file: str = "lab04_results.csv", workers: Optional[int] = None,
+                    time_budget_ms: float = TIME_BUDGET_MS, profile: bool = False):
+    """Прогоняет матрицу data_type x size x алгоритм на пуле процессов.
+
+    Каждая ячейка выполняется в отдельной задаче, воркеры закреплены за ядрами.
+    Строки дописываются в csv_file по мере готовности; уже записанные ячейки
+    при повторном запуске пропускаются. Следующий размер для алгоритма не
+    запускается, если прогноз его медианного времени превышает time_budget_ms.
+    profile=True добавляет колонки памяти (tracemalloc) и счётчиков сравнений/записей.
+    """
     print(PC_INFO)
-    for data_type in data_types:
-        for n in sizes:
-            data = generate_data(n, data_type)
-            for name, func in SORT_FUNCTIONS.items():
-                # Пропускаем квадратичные для очень больших n ради практичности
-                if n > 10000 and name in ("bubble_sort", "selection_sort", "insertion_sort"):
-                    print(f"Skipping {name} for n={n} (practical limit)")
-                    continue
-                t = measure_sort_time(func, data, runs=runs)
-                # проверка корректности
-                out = func(data.copy())
-                assert is_sorted(out), f"{name} failed correctness for n={n}, type={data_type}"
-                results.append((name, n, data_type, t))
-                print(f"{name:15} | type={data_type:12} | n={n:6} -> {t:8.3f} ms")
-    # Сохраняем CSV
-    with open(csv_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["algorithm", "size", "data_type", "time_ms"])
-        for row in results:
-            writer.writerow([row[0], row[1], row[2], f"{row[3]:.6f}"])
+    sizes = sorted(sizes)
+    done = _load_done(csv_file, profile)
+    results = [(key[0], key[1], key[2], stats) for key, stats in done.items()]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(workers))
+    cpu_queue = multiprocessing.Queue()
+    for cpu in cpus[:workers]:
+        cpu_queue.put(cpu)
+
+    # цепочка = (алгоритм, тип данных); размеры внутри цепочки идут по возрастанию
+    history: Dict[Tuple[str, str], List[Tuple[int, float]]] = {}
+    pending: Dict = {}
+
+    def next_cell(name: str, data_type: str, start: int) -> None:
+        chain = history.setdefault((name, data_type), [])
+        for i in range(start, len(sizes)):
+            n = sizes[i]
+            stats = done.get((name, n, data_type))
+            if stats is not None:
+                chain.append((n, stats["median_ms"]))
+                continue
+            if chain and _predict_ms(chain, n) > time_budget_ms:
+                print(f"Skipping {name} for n>={n}, type={data_type} (time budget {time_budget_ms:.0f} ms)")
+                return
+            fut = pool.submit(_run_cell, name, n, data_type, runs, profile)
+            pending[fut] = (name, data_type, i)
+            return
+
+    with open(csv_file, "a", newline="", encoding="utf-8") as f, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_pin_worker, initargs=(cpu_queue,)) as pool:
+        writer = csv.writer(f)  # заголовок уже записан _load_done
+        for data_type in data_types:
+            for name in SORT_FUNCTIONS:
+                next_cell(name, data_type, 0)
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                name, data_type, i = pending.pop(fut)
+                n = sizes[i]
+                stats = fut.result()
+                writer.writerow(_csv_row(name, n, data_type, stats))
+                f.flush()
+                results.append((name, n, data_type, stats))
+                history[(name, data_type)].append((n, stats["median_ms"]))
+                print(f"{name:20} | type={data_type:13} | n={n:6} -> "
+                      f"min {stats['min_ms']:9.3f} | median {stats['median_ms']:9.3f} | "
+                      f"stdev {stats['stdev_ms']:7.3f} ms")
+                next_cell(name, data_type, i + 1)
     print(f"Saved results to {csv_file}")
     return results
 
 
+def run_parallel_benchmark(n: int = 1_000_000, workers_list: Optional[List[int]] = None, runs: int = 3):
+    """Ускорение parallel_sort относительно одного процесса для разного числа воркеров."""
+    if workers_list is None:
+        cpus = os.cpu_count() or 1
+        workers_list = sorted({1, 2, 4, 8, 16, cpus})
+    print(PC_INFO)
+    data = generate_data(n, "random")
+    results = []
+    base: Optional[float] = None
+    for w in workers_list:
+        # threshold=0 — чтобы и для малых n действительно запускались процессы
+        t = measure_sort_time(lambda a, w=w: parallel_sort(a, workers=w, threshold=0), data, runs=runs)
+        if base is None:
+            base = t
+        results.append((w, t, base / t))
+        print(f"parallel_sort | n={n:8} | workers={w:3} -> {t:10.3f} ms | speedup x{base / t:5.2f}")
+    return results
+
+
+def run_selection_benchmark(n: int = 100_000, ratios: Optional[List[float]] = None, runs: int = 5):
+    """Сравнивает выбор k наименьших с полной сортировкой и срезом для разных k/n."""
+    if ratios is None:
+        ratios = [0.0001, 0.001, 0.01, 0.1, 0.5, 1.0]
+    print(PC_INFO)
+    data = generate_data(n, "random")
+    reference = sorted(data)
+    results = []
+    for ratio in ratios:
+        k = max(1, int(n * ratio))
+        candidates = {
+            "intro_sort[:k]": lambda k=k: intro_sort(data)[:k],
+            "partial_sort": lambda k=k: partial_sort(data, k),
+            "top_k": lambda k=k: top_k(iter(data), k),
+            "nth_element": lambda k=k: nth_element(data, k - 1),
+        }
+        for name, stmt in candidates.items():
+            times = [t * 1000.0 for t in timeit.repeat(stmt, repeat=runs, number=1)]
+            out = stmt()
+            expected = reference[k - 1] if name == "nth_element" else reference[:k]
+            assert out == expected, f"{name} failed for k={k}"
+            t = statistics.median(times)
+            results.append((name, n, k, t))
+            print(f"{name:15} | n={n:8} | k={k:8} (k/n={ratio:<7}) -> {t:10.3f} ms")
+    return results
+
+
 if __name__ == "__main__":
-    # Примерные параметры
-    sizes = [100, 500, 1000, 5000, 10000]
-    data_types = ["random", "sorted", "reversed", "almost_sorted"]
-    run_experiments(sizes, data_types, runs=3)
+    if "--parallel" in sys.argv:
+        run_parallel_benchmark()
+    elif "--selection" in sys.argv:
+        run_selection_benchmark()
+    else:
+        # Примерные параметры
+        sizes = [100, 500, 1000, 5000, 10000]
+        data_types = ["random", "sorted", "reversed", "almost_sorted"]
+        run_experiments(sizes, data_types, runs=5, profile="--profile" in sys.argv)
@@ -59,7 +59,40 @@ def plot_time_vs_type(data, size: int = 5000):
     plt.close()
 
 
+def load_memory_csv(csv_file: str = "lab 04/src/lab04_results.csv"):
+    """Читает колонку peak_kb (заполняется при запуске performance_test с --profile)."""
+    data = defaultdict(list)
+    with open(csv_file, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            if not row.get("peak_kb"):
+                continue
+            data[row["algorithm"]].append((int(row["size"]), row["data_type"], float(row["peak_kb"])))
+    return data
+
+
+def plot_memory_vs_size(data, data_type: str = "random"):
+    plt.figure()
+    for alg, rows in data.items():
+        points = sorted((r[0], r[2]) for r in rows if r[1] == data_type)
+        if points:
+            plt.plot([p[0] for p in points], [p[1] for p in points], marker='o', label=alg)
+    plt.xlabel("Size (n)")
+    plt.ylabel("Peak memory (KB)")
+    plt.title(f"Peak memory vs Size (data_type={data_type})")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+
+    save_path = os.path.join(os.path.dirname(__file__), f"memory_vs_size_{data_type}.png")
+    plt.savefig(save_path, dpi=300)
+    plt.close()
+
+
 if __name__ == "__main__":
     data = load_csv()
     plot_time_vs_size(data, data_type="random")
     plot_time_vs_type(data, size=5000)
+    memory = load_memory_csv()
+    for dtype in ["random", "sorted", "reversed", "almost_sorted"]:
+        plot_memory_vs_size(memory, data_type=dtype)
@@ -0,0 +1,101 @@
+"""Частичная сортировка и выбор k-й порядковой статистики."""
+from typing import Iterable, List
+
+from sorts import (INSERTION_THRESHOLD, _choose_pivot, _heap_sort_range, _insertion_sort_range,
+                   _intro_sort_loop, _partition3, _sift_down)
+
+# Размер групп в алгоритме "медиана медиан"
+MOM_GROUP: int = 5
+
+
+def _median_of_medians(arr: List[int], lo: int, hi: int) -> int:
+    """Опорный элемент "медиана медиан" для arr[lo:hi+1] (гарантирует линейное время выбора).
+
+    Группы по MOM_GROUP сортируются вставками на месте, их медианы выбираются рекурсивно.
+    """
+    medians: List[int] = []
+    for start in range(lo, hi + 1, MOM_GROUP):
+        end = min(start + MOM_GROUP, hi + 1) - 1
+        _insertion_sort_range(arr, start, end)
+        medians.append(arr[(start + end) // 2])
+    mid = len(medians) // 2
+    _select_inplace(medians, mid, 0, len(medians) - 1)
+    return medians[mid]
+
+
+def _select_inplace(arr: List[int], k: int, lo: int, hi: int) -> None:
+    """Introselect: переставляет arr[lo:hi+1] так, что arr[k] стоит на своём месте.
+
+    Слева от k — элементы <= arr[k], справа — >= arr[k].
+    Пока глубина не превысила 2*log2(n), опорный — медиана трёх / ninther,
+    затем — медиана медиан, что даёт O(n) в худшем случае.
+    """
+    depth_limit = 2 * (hi - lo + 1).bit_length()
+    while hi - lo + 1 > INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            pivot = _median_of_medians(arr, lo, hi)
+        else:
+            depth_limit -= 1
+            pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _partition3(arr, lo, hi, pivot)
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return
+    _insertion_sort_range(arr, lo, hi)
+
+
+def nth_element(a: List[int], k: int) -> int:
+    """Возвращает k-й по возрастанию элемент (k с нуля), как sorted(a)[k].
+
+    Avg: O(n), Worst: O(n) (медиана медиан после исчерпания глубины)
+    Space: O(n) на копию входа
+    """
+    if not 0 <= k < len(a):
+        raise IndexError("k out of range")
+    arr = a.copy()
+    _select_inplace(arr, k, 0, len(arr) - 1)
+    return arr[k]
+
+
+def partial_sort(a: List[int], k: int) -> List[int]:
+    """Возвращает k наименьших элементов a по возрастанию, как sorted(a)[:k].
+
+    Сначала introselect отделяет k наименьших, затем сортируется только префикс.
+    Время: O(n + k log k), память: O(n) на копию входа.
+    """
+    n = len(a)
+    k = max(0, min(k, n))
+    if k == 0:
+        return []
+    arr = a.copy()
+    if k < n:
+        _select_inplace(arr, k - 1, 0, n - 1)
+    _intro_sort_loop(arr, 0, k - 1, 2 * k.bit_length())
+    del arr[k:]
+    return arr
+
+
+def top_k(iterable: Iterable[int], k: int) -> List[int]:
+    """Потоково находит k наименьших значений (по возрастанию) с помощью max-кучи размера k.
+
+    Время: O(n log k), память: O(k) — вход не материализуется.
+    """
+    if k <= 0:
+        return []
+    heap: List[int] = []
+    it = iter(iterable)
+    for x in it:
+        heap.append(x)
+        if len(heap) == k:
+            break
+    for root in range(len(heap) // 2 - 1, -1, -1):
+        _sift_down(heap, 0, root, len(heap))
+    for x in it:
+        if x < heap[0]:  # новый элемент меньше наибольшего из k лучших
+            heap[0] = x
+            _sift_down(heap, 0, 0, k)
+    _heap_sort_range(heap, 0, len(heap) - 1)
+    return heap
@@ -1,4 +1,7 @@
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple
+
+from array_sorts import bitonic_sort, counting_sort, radix_sort
 
 PC_INFO: str = ( """
 Характеристики ПК для тестирования:
@@ -122,6 +125,343 @@ def quick_sort(a: List[int]) -> List[int]:
     return quick_sort(less) + equal + quick_sort(greater)
 
 
+# Порог, ниже которого отрезок досортировывается вставками
+INSERTION_THRESHOLD: int = 16
+# Начиная с этого размера опорный выбирается ninther (медиана трёх медиан)
+NINTHER_THRESHOLD: int = 128
+
+
+def _insertion_sort_range(arr: List[int], lo: int, hi: int) -> None:
+    """Сортировка вставками отрезка arr[lo:hi+1] на месте.
+
+    Время: O(k^2) для отрезка длины k, память: O(1).
+    """
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _sift_down(arr: List[int], lo: int, root: int, size: int) -> None:
+    """Просеивание вниз в max-куче, лежащей в arr[lo:lo+size]."""
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if arr[lo + root] >= arr[lo + child]:
+            return
+        arr[lo + root], arr[lo + child] = arr[lo + child], arr[lo + root]
+        root = child
+
+
+def _heap_sort_range(arr: List[int], lo: int, hi: int) -> None:
+    """Пирамидальная сортировка отрезка arr[lo:hi+1] на месте.
+
+    Время: O(k log k) в худшем случае, память: O(1).
+    """
+    size = hi - lo + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _median_of_three(arr: List[int], i: int, j: int, k: int) -> int:
+    """Возвращает индекс медианы из arr[i], arr[j], arr[k]."""
+    a, b, c = arr[i], arr[j], arr[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def _choose_pivot(arr: List[int], lo: int, hi: int) -> int:
+    """Выбор опорного: медиана трёх или ninther для больших отрезков."""
+    mid = (lo + hi) // 2
+    if hi - lo + 1 < NINTHER_THRESHOLD:
+        return _median_of_three(arr, lo, mid, hi)
+    step = (hi - lo + 1) // 8
+    return _median_of_three(
+        arr,
+        _median_of_three(arr, lo, lo + step, lo + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, hi - 2 * step, hi - step, hi),
+    )
+
+
+def _partition3(arr: List[int], lo: int, hi: int, pivot: int) -> Tuple[int, int]:
+    """Трёхпутевое разбиение (Dutch national flag) отрезка arr[lo:hi+1].
+
+    После вызова: arr[lo:lt] < pivot, arr[lt:gt+1] == pivot, arr[gt+1:hi+1] > pivot.
+    Возвращает (lt, gt). Время O(k), память O(1).
+    """
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        x = arr[i]
+        if x < pivot:
+            arr[lt], arr[i] = x, arr[lt]
+            lt += 1
+            i += 1
+        elif x > pivot:
+            arr[i], arr[gt] = arr[gt], x
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _intro_sort_loop(arr: List[int], lo: int, hi: int, depth_limit: int) -> None:
+    """Основной цикл интроспективной сортировки для arr[lo:hi+1].
+
+    Рекурсия идёт только в меньшую часть, по большей — цикл,
+    поэтому глубина стека не превышает O(log n).
+    """
+    while hi - lo + 1 > INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            _heap_sort_range(arr, lo, hi)
+            return
+        depth_limit -= 1
+        pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _partition3(arr, lo, hi, pivot)
+        if lt - lo < hi - gt:
+            _intro_sort_loop(arr, lo, lt - 1, depth_limit)
+            lo = gt + 1
+        else:
+            _intro_sort_loop(arr, gt + 1, hi, depth_limit)
+            hi = lt - 1
+    _insertion_sort_range(arr, lo, hi)
+
+
+def intro_sort_inplace(arr: List[int]) -> None:
+    """Сортирует arr на месте интроспективной сортировкой (см. intro_sort)."""
+    n = len(arr)
+    if n > 1:
+        _intro_sort_loop(arr, 0, n - 1, 2 * n.bit_length())
+
+
+def intro_sort(a: List[int]) -> List[int]:
+    """Intro Sort (интроспективная быстрая сортировка), in-place.
+
+    Быстрая сортировка с разбиением на месте: опорный — медиана трёх
+    (ninther для больших отрезков), трёхпутевое разбиение для повторов,
+    вставки на коротких отрезках и пирамидальная сортировка при превышении
+    глубины 2*log2(n).
+
+    Best: O(n) (все элементы равны)
+    Avg: O(n log n)
+    Worst: O(n log n) (за счёт перехода на heap sort)
+    Space: O(log n) стек, без промежуточных списков
+    Устойчивость: неустойчива
+    """
+    # работаем с копией, чтобы не менять входной список (требование экспериментов)
+    arr = a.copy()
+    intro_sort_inplace(arr)
+    return arr
+
+
+def _merge_into(src: List[int], dst: List[int], lo: int, mid: int, hi: int) -> None:
+    """Устойчиво сливает src[lo:mid] и src[mid:hi] в dst[lo:hi]. Время O(hi - lo)."""
+    if src[mid - 1] <= src[mid]:  # части уже упорядочены — просто копируем
+        dst[lo:hi] = src[lo:hi]
+        return
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+    dst[k:k + mid - i] = src[i:mid]
+    k += mid - i
+    dst[k:hi] = src[j:hi]
+
+
+def merge_sort_bottom_up(a: List[int]) -> List[int]:
+    """Merge Sort (итеративный, снизу вверх) с одним вспомогательным буфером.
+
+    Блоки по INSERTION_THRESHOLD сортируются вставками, затем сливаются
+    проходами с удвоением ширины; на каждом проходе массив и буфер
+    меняются ролями, поэтому новых списков по ходу работы не создаётся.
+
+    Best/Avg/Worst: O(n log n)
+    Space: O(n) (один буфер на всё время сортировки)
+    Устойчивость: устойчива
+    """
+    src = a.copy()
+    n = len(src)
+    if n <= 1:
+        return src
+    for lo in range(0, n, INSERTION_THRESHOLD):
+        _insertion_sort_range(src, lo, min(lo + INSERTION_THRESHOLD, n) - 1)
+    dst: List[int] = [0] * n
+    width = INSERTION_THRESHOLD
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = lo + width
+            hi = min(mid + width, n)
+            if mid >= n:
+                dst[lo:n] = src[lo:n]
+            else:
+                _merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+# Сколько побед подряд одной стороны включает режим "галопа" при слиянии
+MIN_GALLOP: int = 7
+
+
+def _gallop_right(arr: List[int], key: int, lo: int, hi: int) -> int:
+    """Первый индекс в отсортированном arr[lo:hi] с элементом > key.
+
+    Экспоненциальный поиск от lo, затем бинарный: O(log k), где k — ответ - lo.
+    """
+    ofs = 1
+    while lo + ofs < hi and arr[lo + ofs] <= key:
+        ofs <<= 1
+    return bisect_right(arr, key, lo + (ofs >> 1), min(lo + ofs + 1, hi))
+
+
+def _gallop_left(arr: List[int], key: int, lo: int, hi: int) -> int:
+    """Первый индекс в отсортированном arr[lo:hi] с элементом >= key. O(log k)."""
+    ofs = 1
+    while lo + ofs < hi and arr[lo + ofs] < key:
+        ofs <<= 1
+    return bisect_left(arr, key, lo + (ofs >> 1), min(lo + ofs + 1, hi))
+
+
+def _merge_galloping(src: List[int], dst: List[int], lo: int, mid: int, hi: int) -> None:
+    """Устойчивое слияние src[lo:mid] и src[mid:hi] в dst[lo:hi] с галопом.
+
+    Уже стоящие на месте префикс левой и суффикс правой части копируются
+    целиком; если одна сторона выигрывает MIN_GALLOP раз подряд, её серия
+    находится экспоненциальным поиском и копируется срезом.
+    """
+    if src[mid - 1] <= src[mid]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    i = _gallop_right(src, src[mid], lo, mid)
+    dst[lo:i] = src[lo:i]
+    end = _gallop_left(src, src[mid - 1], mid, hi)
+    dst[end:hi] = src[end:hi]
+    j, k = mid, i
+    left_wins = right_wins = 0
+    while i < mid and j < end:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP and j < end:
+                e = _gallop_left(src, src[i], j, end)
+                dst[k:k + e - j] = src[j:e]
+                k += e - j
+                j = e
+                right_wins = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and i < mid:
+                e = _gallop_right(src, src[j], i, mid)
+                dst[k:k + e - i] = src[i:e]
+                k += e - i
+                i = e
+                left_wins = 0
+    dst[k:k + mid - i] = src[i:mid]
+    k += mid - i
+    dst[k:end] = src[j:end]
+
+
+def _min_run(n: int) -> int:
+    """Минимальная длина серии (как в TimSort): значение в [32, 64]."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _find_runs(arr: List[int]) -> List[int]:
+    """Разбивает arr на упорядоченные серии, возвращает границы [0, ..., n].
+
+    Строго убывающие серии разворачиваются на месте (это сохраняет
+    устойчивость), короткие серии добиваются вставками до _min_run(n).
+    """
+    n = len(arr)
+    min_run = _min_run(n)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        end = lo + 1
+        if end < n:
+            if arr[end] < arr[lo]:
+                while end + 1 < n and arr[end + 1] < arr[end]:
+                    end += 1
+                end += 1
+                arr[lo:end] = arr[lo:end][::-1]
+            else:
+                while end + 1 < n and arr[end + 1] >= arr[end]:
+                    end += 1
+                end += 1
+        if end - lo < min_run and end < n:
+            end = min(lo + min_run, n)
+            _insertion_sort_range(arr, lo, end - 1)
+        bounds.append(end)
+        lo = end
+    return bounds
+
+
+def natural_merge_sort(a: List[int]) -> List[int]:
+    """Natural Merge Sort (в духе TimSort): слияние готовых серий с галопом.
+
+    Находит возрастающие и убывающие серии, затем сливает соседние серии
+    попарно, чередуя массив и один вспомогательный буфер.
+
+    Best: O(n) (отсортированный / обратный порядок — одна серия)
+    Avg/Worst: O(n log r), r — число серий (r <= n / 32)
+    Space: O(n) (один буфер)
+    Устойчивость: устойчива
+    """
+    src = a.copy()
+    n = len(src)
+    if n <= 1:
+        return src
+    bounds = _find_runs(src)
+    if len(bounds) == 2:
+        return src
+    dst: List[int] = [0] * n
+    while len(bounds) > 2:
+        merged = [0]
+        for p in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[p], bounds[p + 1]
+            if p + 2 < len(bounds):
+                hi = bounds[p + 2]
+                _merge_galloping(src, dst, lo, mid, hi)
+                merged.append(hi)
+            else:
+                dst[lo:mid] = src[lo:mid]
+                merged.append(mid)
+        bounds = merged
+        src, dst = dst, src
+    return src
+
+
 # Мапа алгоритмов
 SORT_FUNCTIONS = {
     "bubble_sort": bubble_sort,
@@ -129,4 +469,10 @@ SORT_FUNCTIONS = {
     "insertion_sort": insertion_sort,
     "merge_sort": merge_sort,
     "quick_sort": quick_sort,
+    "intro_sort": intro_sort,
+    "merge_sort_bottom_up": merge_sort_bottom_up,
+    "natural_merge_sort": natural_merge_sort,
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+    "bitonic_sort": bitonic_sort,
 }
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""Потоковая проверка скобок для больших входов (ЛР-02)."""
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from typing import IO, Iterable, Optional, Union
+
+PAIRS = {')': '(', ']': '[', '}': '{'}
+OPENING = frozenset(PAIRS.values())
+# Регулярное выражение находит только скобки: участки без скобок
+# пропускаются целиком на уровне C, без цикла Python по каждому символу.
+_BRACKET_RE = re.compile(r"[()\[\]{}]")
+_BRACKET_RE_BYTES = re.compile(rb"[()\[\]{}]")
+CHUNK_SIZE: int = 1 << 20
+
+Chunk = Union[str, bytes]
+
+
+@dataclass
+class BracketResult:
+    """Результат проверки: ok, смещение первой ошибки (в символах/байтах) и описание."""
+
+    ok: bool
+    offset: Optional[int] = None
+    message: str = ""
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+def _chunks(source: Union[Iterable[Chunk], IO], chunk_size: int) -> Iterable[Chunk]:
+    """Файловый объект читается блоками по chunk_size, остальное итерируется как есть."""
+    if hasattr(source, "read"):
+        return iter(lambda: source.read(chunk_size), source.read(0))
+    return source
+
+
+def check_brackets(source: Union[Iterable[Chunk], IO], chunk_size: int = CHUNK_SIZE) -> BracketResult:
+    """Проверяет сбалансированность скобок в потоке кусков (str или bytes) или в файле.
+
+    Время: O(n) (нескобочные символы пропускает регулярное выражение),
+    память: O(d), d — максимальная глубина вложенности, плюс один кусок.
+    При незакрытых скобках offset указывает на последнюю открытую.
+    """
+    stack: list[tuple[str, int]] = []  # (открывающая скобка, её смещение)
+    base = 0
+    for chunk in _chunks(source, chunk_size):
+        is_bytes = isinstance(chunk, (bytes, bytearray))
+        pattern = _BRACKET_RE_BYTES if is_bytes else _BRACKET_RE
+        for match in pattern.finditer(chunk):
+            char = match.group().decode() if is_bytes else match.group()
+            if char in OPENING:
+                stack.append((char, base + match.start()))
+            elif not stack:
+                return BracketResult(False, base + match.start(), f"unexpected {char!r}")
+            else:
+                opening, where = stack.pop()
+                if opening != PAIRS[char]:
+                    return BracketResult(False, base + match.start(),
+                                         f"{char!r} does not match {opening!r} at offset {where}")
+        base += len(chunk)
+    if stack:
+        opening, where = stack[-1]
+        return BracketResult(False, where, f"{opening!r} is never closed ({len(stack)} unclosed)")
+    return BracketResult(True)
+
+
+def check_brackets_file(path: str, chunk_size: int = CHUNK_SIZE) -> BracketResult:
+    """Проверка файла без загрузки целиком; смещения — в байтах."""
+    with open(path, "rb") as f:
+        return check_brackets(f, chunk_size)
@@ -0,0 +1,134 @@
+"""Очереди для схемы "производители / потребители" на узлах связного списка (ЛР-02)."""
+from __future__ import annotations
+import asyncio
+import queue
+import threading
+from typing import Any, Optional
+
+from linked_list import LinkedList, Node
+
+
+class TwoLockQueue:
+    """Ограниченная MPMC-очередь с двумя блокировками (схема Майкла — Скотта).
+
+    Узлы — Node из linked_list. Голова всегда указывает на фиктивный узел,
+    поэтому put меняет только хвост (под tail_lock), а get — только голову
+    (под head_lock): производители и потребители не конкурируют за одну
+    блокировку. Счётчики элементов и свободных мест — семафоры; размер для
+    qsize() меняют обе стороны, поэтому он защищён своей маленькой блокировкой.
+    maxsize <= 0 — без ограничения размера.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._head = self._tail = Node(None)  # фиктивный узел
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._items = threading.Semaphore(0)
+        self._slots: Optional[threading.Semaphore] = threading.Semaphore(maxsize) if maxsize > 0 else None
+        self._size = 0  # только для qsize(), под _size_lock
+        self._size_lock = threading.Lock()
+
+    def qsize(self) -> int:
+        """Текущий размер (как у queue.Queue, может сразу устареть). Сложность O(1)."""
+        with self._size_lock:
+            return self._size
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Кладёт элемент в хвост; при заполненной очереди ждёт или бросает queue.Full. O(1)."""
+        if self._slots is not None and not self._slots.acquire(block, timeout):
+            raise queue.Full
+        node = Node(item)
+        with self._tail_lock:
+            self._tail.next = node
+            self._tail = node
+        with self._size_lock:
+            self._size += 1
+        self._items.release()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Забирает элемент из головы; при пустой очереди ждёт или бросает queue.Empty. O(1)."""
+        if not self._items.acquire(block, timeout):
+            raise queue.Empty
+        with self._head_lock:
+            node = self._head.next
+            self._head = node  # node становится новым фиктивным узлом
+        with self._size_lock:
+            self._size -= 1
+        item, node.data = node.data, None
+        if self._slots is not None:
+            self._slots.release()
+        return item
+
+    def get_many(self, n: int, block: bool = True, timeout: Optional[float] = None) -> list[Any]:
+        """Забирает от 1 до n элементов за одну блокировку головы.
+
+        Ждёт только первый элемент, остальные берутся, если уже есть. O(k).
+        """
+        if not self._items.acquire(block, timeout):
+            raise queue.Empty
+        taken = 1
+        while taken < n and self._items.acquire(False):
+            taken += 1
+        items: list[Any] = []
+        with self._head_lock:
+            for _ in range(taken):
+                node = self._head.next
+                self._head = node
+                items.append(node.data)
+                node.data = None
+        with self._size_lock:
+            self._size -= taken
+        if self._slots is not None:
+            self._slots.release(taken)
+        return items
+
+
+class AsyncLinkedQueue:
+    """Ограниченная asyncio-очередь на LinkedList с обратным давлением.
+
+    put ждёт, пока есть место (maxsize <= 0 — без ограничения), get — пока
+    есть элемент. Внутри одного цикла событий блокировки потоков не нужны:
+    ожидание сделано на двух asyncio.Condition с общей блокировкой.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._items = LinkedList()
+        lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(lock)
+        self._not_full = asyncio.Condition(lock)
+
+    def qsize(self) -> int:
+        """Текущий размер. Сложность O(1)."""
+        return len(self._items)
+
+    def full(self) -> bool:
+        """Заполнена ли очередь. Сложность O(1)."""
+        return 0 < self.maxsize <= len(self._items)
+
+    async def put(self, item: Any) -> None:
+        """Кладёт элемент в хвост, ожидая свободного места. O(1)."""
+        async with self._not_full:
+            while self.full():
+                await self._not_full.wait()
+            self._items.insert_at_end(item)
+            self._not_empty.notify()
+
+    async def get(self) -> Any:
+        """Забирает элемент из головы, ожидая его появления. O(1)."""
+        async with self._not_empty:
+            while not len(self._items):
+                await self._not_empty.wait()
+            item = self._items.delete_from_start()
+            self._not_full.notify()
+            return item
+
+    async def get_many(self, n: int) -> list[Any]:
+        """Ждёт хотя бы один элемент и забирает до n сразу. O(k)."""
+        async with self._not_empty:
+            while not len(self._items):
+                await self._not_empty.wait()
+            items = [self._items.delete_from_start() for _ in range(min(n, len(self._items)))]
+            self._not_full.notify(len(items))
+            return items
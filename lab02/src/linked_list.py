@@ -1,10 +1,15 @@
 """Реализация односвязного списка (ЛР-02)."""
 from __future__ import annotations
-from typing import Any, Optional
+from array import array
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+_MISSING = object()
 
 
 class Node:
-    """Узел связного списка."""
+    """Узел связного списка (__slots__ — без __dict__ у каждого узла)."""
+
+    __slots__ = ("data", "next")
 
     def __init__(self, data: Any) -> None:
         self.data: Any = data
@@ -17,6 +22,119 @@ class LinkedList:
     def __init__(self) -> None:
         self.head: Optional[Node] = None
         self.tail: Optional[Node] = None  # Для O(1) вставки в конец
+        self._size: int = 0  # Для O(1) __len__
+        self._version: int = 0  # Растёт при любом изменении (защита итераторов)
+        self._unlinks: int = 0  # Растёт при удалении из середины (защита снимков)
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any]) -> LinkedList:
+        """Создаёт список из последовательности. Сложность O(n)."""
+        ll = cls()
+        ll.extend(items)
+        return ll
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность O(1)."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Ленивый обход от головы к хвосту. O(1) на шаг, O(1) памяти.
+
+        Если список изменён во время обхода, бросает RuntimeError.
+        """
+        version = self._version
+        current = self.head
+        while current:
+            yield current.data
+            if self._version != version:
+                raise RuntimeError("LinkedList mutated during iteration")
+            current = current.next
+
+    def snapshot(self) -> Iterator[Any]:
+        """Итератор по текущему состоянию списка. Создание O(1), без копирования.
+
+        Запоминает голову и длину, поэтому последующие insert_at_start,
+        insert_at_end и delete_from_start на него не влияют (узлы снимка не
+        меняются). Удаление из середины (remove_first) делает снимок
+        недействительным — тогда бросается RuntimeError.
+        """
+        unlinks = self._unlinks
+        head, size = self.head, self._size  # фиксируются сразу, а не при первом next()
+
+        def walk() -> Iterator[Any]:
+            current, remaining = head, size
+            while remaining:
+                if self._unlinks != unlinks:
+                    raise RuntimeError("LinkedList snapshot invalidated by remove_first")
+                yield current.data
+                current = current.next
+                remaining -= 1
+
+        return walk()
+
+    def iter_slice(self, start: int = 0, stop: Optional[int] = None, step: int = 1) -> Iterator[Any]:
+        """Ленивый срез как itertools.islice: элементы start, start+step, ... до stop.
+
+        Сложность O(stop) — обход останавливается на stop, память O(1).
+        """
+        if start < 0 or (stop is not None and stop < 0) or step <= 0:
+            raise ValueError("iter_slice supports only non-negative start/stop and positive step")
+        for i, data in enumerate(self):
+            if stop is not None and i >= stop:
+                return
+            if i >= start and (i - start) % step == 0:
+                yield data
+
+    def find(self, predicate: Callable[[Any], bool], default: Any = None) -> Any:
+        """Первый элемент, для которого predicate истинно, иначе default.
+
+        Обход останавливается на первом совпадении. Сложность O(k).
+        """
+        for data in self:
+            if predicate(data):
+                return data
+        return default
+
+    def remove_first(self, value: Any) -> bool:
+        """Удаляет первое вхождение value. Возвращает True, если удалено. Сложность O(k)."""
+        prev: Optional[Node] = None
+        current = self.head
+        while current:
+            if current.data == value:
+                if prev is None:
+                    self.delete_from_start()
+                    return True
+                prev.next = current.next
+                if current is self.tail:
+                    self.tail = prev
+                self._size -= 1
+                self._version += 1
+                self._unlinks += 1
+                return True
+            prev, current = current, current.next
+        return False
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Добавляет элементы в конец одной цепочкой. Сложность O(k)."""
+        it = iter(items)
+        for first in it:
+            break
+        else:
+            return
+        start = last = Node(first)  # O(1)
+        count = 1
+        for data in it:  # O(k)
+            node = Node(data)
+            last.next = node
+            last = node
+            count += 1
+        if self.tail:
+            self.tail.next = start
+        else:
+            self.head = start
+        self.tail = last
+        self._size += count
+        self._version += 1
 
     def insert_at_start(self, data: Any) -> None:
         """Вставка элемента в начало. Сложность O(1)."""
@@ -25,6 +143,8 @@ class LinkedList:
         self.head = new_node  # O(1)
         if self.tail is None:  # O(1)
             self.tail = new_node  # O(1)
+        self._size += 1  # O(1)
+        self._version += 1  # O(1)
 
     def insert_at_end(self, data: Any) -> None:
         """Вставка элемента в конец. Сложность O(1) при наличии tail."""
@@ -34,6 +154,8 @@ class LinkedList:
             self.tail = new_node  # O(1)
         else:
             self.head = self.tail = new_node  # O(1)
+        self._size += 1  # O(1)
+        self._version += 1  # O(1)
 
     def delete_from_start(self) -> Optional[Any]:
         """Удаление элемента из начала. Сложность O(1)."""
@@ -43,13 +165,105 @@ class LinkedList:
         self.head = self.head.next  # O(1)
         if self.head is None:  # O(1)
             self.tail = None  # O(1)
+        self._size -= 1  # O(1)
+        self._version += 1  # O(1)
         return removed_data  # O(1)
 
+    def traversal(self) -> list[Any]:
+        """Возвращает список элементов. Сложность O(n).
+
+        Для потоковой обработки без копии используйте итерацию (for x in ll).
+        """
+        return list(self)  # O(n)
+
+
+class PooledLinkedList:
+    """Односвязный список в виде "структуры массивов" (struct-of-arrays).
+
+    Узел — это индекс: данные лежат в списке _data, ссылка на следующий
+    узел — в массиве целых _next (-1 означает конец). Освобождённые индексы
+    попадают в free-list и переиспользуются, поэтому объектов-узлов нет вовсе.
+    API совпадает с LinkedList.
+    """
+
+    _NIL = -1
+
+    def __init__(self) -> None:
+        self._data: list[Any] = []
+        self._next = array("q")
+        self._free: list[int] = []  # стек свободных индексов
+        self._head: int = self._NIL
+        self._tail: int = self._NIL
+        self._size: int = 0
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any]) -> PooledLinkedList:
+        """Создаёт список из последовательности. Сложность O(n)."""
+        ll = cls()
+        ll.extend(items)
+        return ll
+
+    def _alloc(self, data: Any) -> int:
+        """Выдаёт индекс под новый узел (из free-list или в конце пула). O(1) амортизированно."""
+        if self._free:
+            idx = self._free.pop()
+            self._data[idx] = data
+            self._next[idx] = self._NIL
+            return idx
+        self._data.append(data)
+        self._next.append(self._NIL)
+        return len(self._data) - 1
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность O(1)."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Ленивый обход от головы к хвосту. O(1) на шаг."""
+        data, nxt = self._data, self._next
+        idx = self._head
+        while idx != self._NIL:
+            yield data[idx]
+            idx = nxt[idx]
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Добавляет элементы в конец. Сложность O(k)."""
+        for data in items:
+            self.insert_at_end(data)
+
+    def insert_at_start(self, data: Any) -> None:
+        """Вставка элемента в начало. Сложность O(1)."""
+        idx = self._alloc(data)
+        self._next[idx] = self._head
+        self._head = idx
+        if self._tail == self._NIL:
+            self._tail = idx
+        self._size += 1
+
+    def insert_at_end(self, data: Any) -> None:
+        """Вставка элемента в конец. Сложность O(1)."""
+        idx = self._alloc(data)
+        if self._tail != self._NIL:
+            self._next[self._tail] = idx
+        else:
+            self._head = idx
+        self._tail = idx
+        self._size += 1
+
+    def delete_from_start(self) -> Optional[Any]:
+        """Удаление элемента из начала. Сложность O(1)."""
+        idx = self._head
+        if idx == self._NIL:
+            return None
+        removed_data = self._data[idx]
+        self._data[idx] = None  # не держим ссылку на удалённый объект
+        self._head = self._next[idx]
+        if self._head == self._NIL:
+            self._tail = self._NIL
+        self._free.append(idx)
+        self._size -= 1
+        return removed_data
+
     def traversal(self) -> list[Any]:
         """Возвращает список элементов. Сложность O(n)."""
-        elements: list[Any] = []  # O(1)
-        current = self.head  # O(1)
-        while current:  # O(n)
-            elements.append(current.data)  # O(1)
-            current = current.next  # O(1)
-        return elements  # O(1)
+        return list(self)
@@ -0,0 +1,106 @@
+"""Сравнение памяти на один элемент: list, deque, LinkedList и PooledLinkedList."""
+import tracemalloc
+from collections import deque
+from typing import Callable
+
+from linked_list import LinkedList, PooledLinkedList
+
+
+def bytes_per_element(build: Callable[[int], object], n: int) -> float:
+    """Память (байт) на элемент структуры из n одинаковых элементов по tracemalloc.
+
+    Хранится один и тот же объект, поэтому учитываются только накладные
+    расходы самой структуры, а не элементов.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        container = build(n)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del container
+    return (after - before) / n
+
+
+def build_list(n: int) -> list:
+    """list из n элементов через append."""
+    lst = []
+    for _ in range(n):
+        lst.append(1)
+    return lst
+
+
+def build_deque(n: int) -> deque:
+    """deque из n элементов через append."""
+    d = deque()
+    for _ in range(n):
+        d.append(1)
+    return d
+
+
+def build_linked_list(n: int) -> LinkedList:
+    """LinkedList из n элементов через insert_at_end."""
+    ll = LinkedList()
+    for _ in range(n):
+        ll.insert_at_end(1)
+    return ll
+
+
+def build_pooled_linked_list(n: int) -> PooledLinkedList:
+    """PooledLinkedList из n элементов через insert_at_end."""
+    ll = PooledLinkedList()
+    for _ in range(n):
+        ll.insert_at_end(1)
+    return ll
+
+
+STRUCTURES = {
+    "list": build_list,
+    "deque": build_deque,
+    "LinkedList": build_linked_list,
+    "PooledLinkedList": build_pooled_linked_list,
+}
+
+
+def peak_kb(consume: Callable[[], object]) -> float:
+    """Пиковая дополнительная память (КБ) во время вызова consume()."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        consume()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 1024
+
+
+STREAMING_CONSUMERS = {
+    "sum(traversal())": lambda ll: sum(ll.traversal()),
+    "sum(iter)": lambda ll: sum(ll),
+    "first 10 (iter_slice)": lambda ll: list(ll.iter_slice(0, 10)),
+    "find (early stop)": lambda ll: ll.find(lambda x: x >= 10),
+}
+
+
+def main() -> None:
+    """Печатает таблицу байт на элемент и пиковую память потоковых потребителей для разных N."""
+    sizes = [1000, 10000, 100000, 1000000]
+    print(f"{'structure':>18} | " + " | ".join(f"N={n:>8}" for n in sizes))
+    print("-" * (21 + 13 * len(sizes)))
+    for name, build in STRUCTURES.items():
+        row = [bytes_per_element(build, n) for n in sizes]
+        print(f"{name:>18} | " + " | ".join(f"{b:8.1f} B" for b in row))
+
+    print("\nПиковая память обхода LinkedList (КБ):")
+    lists = {n: LinkedList.from_iterable(range(n)) for n in sizes}
+    print(f"{'consumer':>22} | " + " | ".join(f"N={n:>8}" for n in sizes))
+    print("-" * (25 + 13 * len(sizes)))
+    for name, consume in STREAMING_CONSUMERS.items():
+        row = [peak_kb(lambda ll=lists[n]: consume(ll)) for n in sizes]
+        print(f"{name:>22} | " + " | ".join(f"{kb:8.1f} K" for kb in row))
+
+
+if __name__ == "__main__":
+    main()
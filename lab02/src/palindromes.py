@@ -0,0 +1,96 @@
+"""Проверка палиндромов без лишних копий и поиск самого длинного палиндрома (ЛР-02)."""
+from __future__ import annotations
+from typing import Iterable, Union
+
+
+class _NormalizeTable(dict):
+    """Таблица для str.translate: буквы -> нижний регистр, остальное удаляется.
+
+    Заполняется лениво (__missing__) и кешируется, поэтому работает для любых
+    символов Юникода, а нормализация строки — один проход translate на C.
+    """
+
+    def __missing__(self, code: int):
+        char = chr(code)
+        value = char.lower() if char.isalpha() else None
+        self[code] = value
+        return value
+
+
+_NORMALIZE = _NormalizeTable()
+
+
+def normalize(s: str) -> str:
+    """Оставляет только буквы в нижнем регистре за один проход translate. O(n)."""
+    return s.translate(_NORMALIZE)
+
+
+def is_palindrome(s: Union[str, bytes, bytearray, memoryview], normalized: bool = False) -> bool:
+    """Проверка палиндрома. Время O(n).
+
+    Строка нормализуется (если normalized=False) и сравнивается с
+    перевёрнутым срезом — оба шага выполняются на C.
+    Для bytes / bytearray / memoryview (например, уже закодированных
+    ASCII-данных) сравнивается memoryview с его перевёрнутым представлением —
+    без копирования, память O(1); нормализация к ним не применяется.
+    """
+    if isinstance(s, str):
+        if not normalized:
+            s = normalize(s)
+        return s == s[::-1]
+    view = memoryview(s).cast("B")
+    half = len(view) // 2
+    return view[:half] == view[len(view) - half:][::-1]
+
+
+def is_palindrome_two_pointers(s: str) -> bool:
+    """Проверка двумя индексами на месте, без копий. Время O(n), память O(1)."""
+    i, j = 0, len(s) - 1
+    while i < j:
+        if s[i] != s[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
+
+
+def is_palindrome_batch(strings: Iterable[str], normalized: bool = False) -> list[bool]:
+    """Проверяет множество строк; нормализация и сравнение выполняются на C. O(сумма длин)."""
+    if normalized:
+        return [s == s[::-1] for s in strings]
+    return [s == s[::-1] for s in (t.translate(_NORMALIZE) for t in strings)]
+
+
+def longest_palindrome(s: str) -> str:
+    """Самая длинная палиндромная подстрока алгоритмом Манакера. Время O(n), память O(n).
+
+    odd[i] — радиус нечётного палиндрома с центром i (включая центр),
+    even[i] — радиус чётного палиндрома с центром между i-1 и i.
+    Внутри самого правого найденного палиндрома [left, right] радиус
+    берётся из зеркальной позиции, поэтому каждый символ расширяется один раз.
+    """
+    n = len(s)
+    best_start, best_len = 0, 0
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+        if 2 * k - 1 > best_len:
+            best_start, best_len = i - k + 1, 2 * k - 1
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+        if 2 * k > best_len:
+            best_start, best_len = i - k, 2 * k
+    return s[best_start:best_start + best_len]
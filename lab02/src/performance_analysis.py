@@ -1,8 +1,14 @@
-"""Сравнение производительности list, LinkedList и deque."""
+"""Сравнение производительности list, LinkedList, deque и UnrolledLinkedList."""
+import asyncio
+import queue
+import threading
+import time
 import timeit
 from collections import deque
 import matplotlib.pyplot as plt
+from concurrent_queue import AsyncLinkedQueue, TwoLockQueue
 from linked_list import LinkedList
+from unrolled_list import UnrolledLinkedList
 
 
 def measure_time(func, *args, number: int = 1000) -> float:
@@ -37,6 +43,140 @@ def compare_queue(sizes: list[int]) -> tuple[list[float], list[float]]:
     return deque_times, list_pop_times
 
 
+def compare_structures(sizes: list[int]) -> dict[str, dict[str, list[float]]]:
+    """Время одной операции (мс) для list, LinkedList, deque и UnrolledLinkedList.
+
+    Операции: вставка/удаление в начале, вставка в конец, вставка в середину
+    и полный обход (для обхода — время на один элемент). Если операция
+    структурой не поддерживается, записывается nan.
+    """
+    makers = {
+        "list": list,
+        "LinkedList": LinkedList.from_iterable,
+        "deque": deque,
+        "UnrolledLinkedList": UnrolledLinkedList,
+    }
+    ops = {
+        "push_front": {"list": lambda s: s.insert(0, 1), "LinkedList": lambda s: s.insert_at_start(1),
+                       "deque": lambda s: s.appendleft(1), "UnrolledLinkedList": lambda s: s.appendleft(1)},
+        "push_back": {"list": lambda s: s.append(1), "LinkedList": lambda s: s.insert_at_end(1),
+                      "deque": lambda s: s.append(1), "UnrolledLinkedList": lambda s: s.append(1)},
+        "pop_front": {"list": lambda s: s.pop(0), "LinkedList": lambda s: s.delete_from_start(),
+                      "deque": lambda s: s.popleft(), "UnrolledLinkedList": lambda s: s.popleft()},
+        "insert_middle": {"list": lambda s: s.insert(len(s) // 2, 1), "deque": lambda s: s.insert(len(s) // 2, 1),
+                          "UnrolledLinkedList": lambda s: s.insert(len(s) // 2, 1)},
+        "iterate": {name: lambda s: sum(1 for _ in s) for name in makers},
+    }
+    results: dict[str, dict[str, list[float]]] = {op: {name: [] for name in makers} for op in ops}
+    for n in sizes:
+        for op, funcs in ops.items():
+            for name, make in makers.items():
+                func = funcs.get(name)
+                if func is None:
+                    results[op][name].append(float("nan"))
+                    continue
+                struct = make(range(n))
+                if op == "iterate":
+                    t = timeit.timeit(lambda: func(struct), number=1) * 1000 / n
+                else:
+                    # n операций над структурой из n элементов (pop_front опустошает её)
+                    t = timeit.timeit(lambda: func(struct), number=n) * 1000 / n
+                results[op][name].append(t)
+    return results
+
+
+def plot_structures_graph(sizes: list[int], results: dict[str, dict[str, list[float]]]) -> None:
+    """Графики сравнения структур: по одному файлу на операцию."""
+    for op, by_struct in results.items():
+        plt.figure(figsize=(10, 6))
+        for name, times in by_struct.items():
+            plt.plot(sizes, times, "-o", label=name)
+        plt.xlabel("Количество элементов (N)")
+        plt.ylabel("Время одной операции (мс)")
+        plt.title(f"{op}: list vs LinkedList vs deque vs UnrolledLinkedList")
+        plt.grid(True, linestyle="--", linewidth=0.5)
+        plt.legend()
+        plt.savefig(f"structures_{op}.png", dpi=300, bbox_inches="tight")
+        plt.close()
+
+
+def _threaded_throughput(q, n_items: int, producers: int, consumers: int, batch: int) -> float:
+    """Элементов в секунду через потоковую очередь q (batch > 1 — через get_many)."""
+    per_producer = n_items // producers
+    stop = object()
+
+    def produce() -> None:
+        for i in range(per_producer):
+            q.put(i)
+
+    def consume() -> None:
+        while True:
+            items = q.get_many(batch) if batch > 1 else [q.get()]
+            if stop in items:
+                for _ in range(sum(1 for x in items if x is stop) - 1):
+                    q.put(stop)
+                return
+
+    threads = [threading.Thread(target=consume) for _ in range(consumers)]
+    senders = [threading.Thread(target=produce) for _ in range(producers)]
+    t0 = time.perf_counter()
+    for t in threads + senders:
+        t.start()
+    for t in senders:
+        t.join()
+    for _ in range(consumers):
+        q.put(stop)
+    for t in threads:
+        t.join()
+    return per_producer * producers / (time.perf_counter() - t0)
+
+
+def _async_throughput(make_queue, n_items: int, producers: int, consumers: int, batch: int) -> float:
+    """Элементов в секунду через asyncio-очередь (batch > 1 — через get_many)."""
+    per_producer = n_items // producers
+    stop = object()
+
+    async def run() -> float:
+        q = make_queue()
+
+        async def produce() -> None:
+            for i in range(per_producer):
+                await q.put(i)
+
+        async def consume() -> None:
+            while True:
+                items = await q.get_many(batch) if batch > 1 else [await q.get()]
+                if stop in items:
+                    for _ in range(sum(1 for x in items if x is stop) - 1):
+                        await q.put(stop)
+                    return
+
+        t0 = time.perf_counter()
+        workers = [asyncio.create_task(consume()) for _ in range(consumers)]
+        await asyncio.gather(*(produce() for _ in range(producers)))
+        for _ in range(consumers):
+            await q.put(stop)
+        await asyncio.gather(*workers)
+        return per_producer * producers / (time.perf_counter() - t0)
+
+    return asyncio.run(run())
+
+
+def compare_concurrent_queues(n_items: int = 100000, producers: int = 4, consumers: int = 4,
+                              maxsize: int = 1024, batch: int = 32) -> dict[str, float]:
+    """Пропускная способность (элементов/с) очередей производители/потребители."""
+    return {
+        "queue.Queue": _threaded_throughput(queue.Queue(maxsize), n_items, producers, consumers, 1),
+        "TwoLockQueue.get": _threaded_throughput(TwoLockQueue(maxsize), n_items, producers, consumers, 1),
+        "TwoLockQueue.get_many": _threaded_throughput(TwoLockQueue(maxsize), n_items, producers, consumers, batch),
+        "asyncio.Queue": _async_throughput(lambda: asyncio.Queue(maxsize), n_items, producers, consumers, 1),
+        "AsyncLinkedQueue.get": _async_throughput(lambda: AsyncLinkedQueue(maxsize), n_items, producers,
+                                                  consumers, 1),
+        "AsyncLinkedQueue.get_many": _async_throughput(lambda: AsyncLinkedQueue(maxsize), n_items, producers,
+                                                       consumers, batch),
+    }
+
+
 def plot_insert_graph(sizes: list[int], list_times: list[float],
                       linked_times: list[float]) -> None:
     """График сравнения вставки."""
@@ -74,6 +214,17 @@ def main() -> None:
     plot_insert_graph(sizes, list_times, linked_times)
     plot_queue_graph(sizes, deque_times, list_pop_times)
 
+    structures = compare_structures(sizes)
+    plot_structures_graph(sizes, structures)
+    for op, by_struct in structures.items():
+        print(f"\n{op} (мс на операцию, N={sizes[-1]}):")
+        for name, times in by_struct.items():
+            print(f"  {name:>18}: {times[-1]:.6f}")
+
+    print("\nПропускная способность очередей (4 производителя, 4 потребителя):")
+    for name, rate in compare_concurrent_queues().items():
+        print(f"  {name:>26}: {rate:12.0f} эл/с")
+
     pc_info = """
 Характеристики ПК для тестирования:
 - Процессор: Intel Core i5-10210U @ 1.60GHz
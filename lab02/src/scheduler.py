@@ -0,0 +1,239 @@
+"""Планировщик очереди печати с приоритетами, старением и дедлайнами (ЛР-02)."""
+from __future__ import annotations
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+
+class IndexedHeap:
+    """Двоичная min-куча с картой "ключ -> позиция".
+
+    Карта позволяет изменять приоритет и удалять произвольный элемент
+    за O(log n), а не искать его линейным проходом.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[Any, int, Hashable]] = []  # (приоритет, порядковый номер, ключ)
+        self._pos: dict[Hashable, int] = {}
+        self._counter = 0  # порядок добавления — для устойчивости при равных приоритетах
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pos
+
+    def push(self, key: Hashable, priority: Any) -> None:
+        """Добавление. Сложность O(log n)."""
+        if key in self._pos:
+            raise KeyError(f"{key!r} already in heap")
+        self._heap.append((priority, self._counter, key))
+        self._counter += 1
+        self._pos[key] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> tuple[Hashable, Any]:
+        """Минимальный элемент (ключ, приоритет) без удаления. O(1)."""
+        priority, _, key = self._heap[0]
+        return key, priority
+
+    def pop(self) -> tuple[Hashable, Any]:
+        """Извлечение минимума (ключ, приоритет). Сложность O(log n)."""
+        if not self._heap:
+            raise IndexError("pop from an empty heap")
+        key, priority = self.peek()
+        self._remove_at(0)
+        return key, priority
+
+    def update(self, key: Hashable, priority: Any) -> None:
+        """Изменение приоритета элемента. Сложность O(log n)."""
+        i = self._pos[key]
+        old = self._heap[i][0]
+        self._heap[i] = (priority, self._heap[i][1], key)
+        if priority < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, key: Hashable) -> Any:
+        """Удаление произвольного элемента, возвращает его приоритет. Сложность O(log n)."""
+        i = self._pos[key]
+        priority = self._heap[i][0]
+        self._remove_at(i)
+        return priority
+
+    def _remove_at(self, i: int) -> None:
+        """Удаляет элемент в позиции i: на его место ставится последний и просеивается."""
+        last = self._heap.pop()
+        if i == len(self._heap):  # удалялся как раз последний элемент
+            del self._pos[last[2]]
+            return
+        del self._pos[self._heap[i][2]]
+        self._heap[i] = last
+        self._pos[last[2]] = i
+        self._sift_up(i)
+        self._sift_down(self._pos[last[2]])
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._pos[heap[i][2]] = i
+        self._pos[heap[j][2]] = j
+
+    def _sift_up(self, i: int) -> None:
+        while i > 0:
+            parent = (i - 1) // 2
+            if self._heap[i][:2] >= self._heap[parent][:2]:
+                return
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int) -> None:
+        n = len(self._heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and self._heap[child][:2] < self._heap[smallest][:2]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+
+@dataclass
+class PrintJob:
+    """Задание печати: размер (страниц), приоритет (меньше — важнее), дедлайн, время поступления."""
+
+    name: str
+    size: float
+    priority: int = 0
+    deadline: float = math.inf
+    submitted: float = 0.0
+
+
+# Ключи порядка обслуживания. Старение: ключ растёт не с текущим временем,
+# а со временем поступления. Эффективный приоритет priority - aging * (now - submitted)
+# для всех ожидающих уменьшается одинаково, поэтому порядок задаётся статическим
+# ключом priority + aging * submitted, и кучу не нужно перестраивать со временем.
+POLICIES: dict[str, Callable[[PrintJob, float], tuple]] = {
+    "fifo": lambda job, aging: (job.submitted,),
+    "priority": lambda job, aging: (job.priority + aging * job.submitted, job.submitted),
+    "sjf": lambda job, aging: (job.size + aging * job.submitted, job.submitted),
+    "edf": lambda job, aging: (job.deadline, job.submitted),
+}
+
+
+class PrintScheduler:
+    """Очередь печати на IndexedHeap с выбираемой политикой.
+
+    policy: 'fifo', 'priority', 'sjf' (кратчайшее задание первым), 'edf' (ближайший дедлайн).
+    aging: скорость старения (на единицу времени ожидания) для 'priority' и 'sjf'.
+    """
+
+    def __init__(self, policy: str = "priority", aging: float = 0.0) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy}")
+        self.policy = policy
+        self.aging = aging
+        self._heap = IndexedHeap()
+        self._jobs: dict[int, PrintJob] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _key(self, job: PrintJob) -> tuple:
+        return POLICIES[self.policy](job, self.aging)
+
+    def submit(self, job: PrintJob) -> int:
+        """Ставит задание в очередь, возвращает его id. Сложность O(log n)."""
+        job_id = self._next_id
+        self._next_id += 1
+        self._jobs[job_id] = job
+        self._heap.push(job_id, self._key(job))
+        return job_id
+
+    def cancel(self, job_id: int) -> PrintJob:
+        """Отменяет задание. Сложность O(log n)."""
+        self._heap.remove(job_id)
+        return self._jobs.pop(job_id)
+
+    def reprioritize(self, job_id: int, priority: int) -> None:
+        """Меняет приоритет ожидающего задания. Сложность O(log n)."""
+        job = self._jobs[job_id]
+        job.priority = priority
+        self._heap.update(job_id, self._key(job))
+
+    def next_job(self) -> Optional[PrintJob]:
+        """Следующее задание по политике или None. Сложность O(log n)."""
+        if not len(self._heap):
+            return None
+        job_id, _ = self._heap.pop()
+        return self._jobs.pop(job_id)
+
+
+def synthetic_jobs(n: int, arrival_rate: float = 1.0, mean_size: float = 0.8,
+                   seed: Optional[int] = None) -> list[PrintJob]:
+    """Синтетическая нагрузка: пуассоновский поток, размеры с тяжёлым хвостом, 5 уровней приоритета."""
+    rnd = random.Random(seed)
+    t = 0.0
+    jobs = []
+    for i in range(n):
+        t += rnd.expovariate(arrival_rate)
+        size = rnd.lognormvariate(math.log(mean_size) - 0.5, 1.0)
+        jobs.append(PrintJob(f"job{i}", size, rnd.randrange(5), t + size * rnd.uniform(2, 10), t))
+    return jobs
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    """Перцентиль p (0..100) уже отсортированного списка (метод ближайшего ранга)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def simulate(jobs: list[PrintJob], policy: str = "priority", aging: float = 0.0,
+             speed: float = 1.0) -> dict[str, float]:
+    """Дискретно-событийная симуляция одного принтера (speed страниц в единицу времени).
+
+    Возвращает пропускную способность (заданий в единицу времени), среднюю
+    и p99 задержку (от поступления до окончания печати) и долю пропущенных дедлайнов.
+    """
+    pending = sorted(jobs, key=lambda j: j.submitted)
+    scheduler = PrintScheduler(policy, aging)
+    now = 0.0
+    i = 0
+    latencies: list[float] = []
+    missed = 0
+    while i < len(pending) or len(scheduler):
+        if not len(scheduler):  # принтер простаивает до следующего поступления
+            now = max(now, pending[i].submitted)
+        while i < len(pending) and pending[i].submitted <= now:
+            scheduler.submit(pending[i])
+            i += 1
+        job = scheduler.next_job()
+        now += job.size / speed
+        latencies.append(now - job.submitted)
+        missed += now > job.deadline
+    latencies.sort()
+    return {
+        "throughput": len(latencies) / now if now else 0.0,
+        "mean_latency": sum(latencies) / len(latencies) if latencies else 0.0,
+        "p99_latency": _percentile(latencies, 99),
+        "missed_deadlines": missed / len(latencies) if latencies else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    workload = synthetic_jobs(20000, arrival_rate=1.1, seed=42)
+    print(f"{'policy':>16} | {'throughput':>10} | {'mean':>8} | {'p99':>8} | {'missed':>6}")
+    print("-" * 62)
+    for name, pol, age in [("fifo", "fifo", 0.0), ("priority", "priority", 0.0),
+                           ("priority+aging", "priority", 0.05), ("sjf", "sjf", 0.0),
+                           ("sjf+aging", "sjf", 0.05), ("edf", "edf", 0.0)]:
+        stats = simulate(workload, pol, age)
+        print(f"{name:>16} | {stats['throughput']:10.3f} | {stats['mean_latency']:8.2f} | "
+              f"{stats['p99_latency']:8.2f} | {stats['missed_deadlines']:6.1%}")
@@ -1,30 +1,92 @@
 """Практические задачи из ЛР-02."""
+import threading
 from collections import deque
 
+from brackets import OPENING, PAIRS, check_brackets
+from concurrent_queue import TwoLockQueue
+from palindromes import longest_palindrome, normalize
+from scheduler import PrintJob, PrintScheduler
+
 
 def is_balanced_brackets(s: str) -> bool:
-    """Проверка сбалансированности скобок. Сложность O(n)."""
+    """Проверка сбалансированности скобок. Сложность O(n).
+
+    Для больших файлов и потоков используйте brackets.check_brackets —
+    она же сообщает позицию первой ошибки.
+    """
     stack: list[str] = []  # O(1)
-    brackets = {')': '(', ']': '[', '}': '{'}
     for char in s:  # O(n)
-        if char in brackets.values():
+        if char in OPENING:  # O(1) — множество, а не brackets.values()
             stack.append(char)  # O(1)
-        elif char in brackets:  # O(1)
-            if not stack or stack.pop() != brackets[char]:  # O(1)
+        elif char in PAIRS:  # O(1)
+            if not stack or stack.pop() != PAIRS[char]:  # O(1)
                 return False
     return not stack  # O(1)
 
 
-def print_queue_simulation(jobs: list[str]) -> None:
-    """Симуляция обработки очереди печати. Сложность O(n)."""
-    queue = deque(jobs)  # O(n)
-    while queue:  # O(n)
-        job = queue.popleft()  # O(1)
-        print(f"Печатается: {job}")  # O(1)
+def print_queue_simulation(jobs: list, policy: str = "fifo", aging: float = 0.0) -> None:
+    """Симуляция обработки очереди печати. Сложность O(n log n).
+
+    jobs — строки (все задания одинаковые) или PrintJob с размером,
+    приоритетом и дедлайном; порядок печати задаёт policy планировщика
+    ('fifo', 'priority', 'sjf', 'edf').
+    """
+    scheduler = PrintScheduler(policy, aging)
+    for i, job in enumerate(jobs):  # O(n log n)
+        scheduler.submit(job if isinstance(job, PrintJob) else PrintJob(job, 1.0, submitted=float(i)))
+    while len(scheduler):  # O(n)
+        job = scheduler.next_job()  # O(log n)
+        print(f"Печатается: {job.name}")  # O(1)
+
+
+def print_queue_simulation_mpmc(jobs: list[str], producers: int = 2, consumers: int = 2,
+                                maxsize: int = 16, batch: int = 4, verbose: bool = True) -> list[str]:
+    """Очередь печати с producers отправителями и consumers принтерами. Сложность O(n).
+
+    Отправители кладут задания в общую ограниченную TwoLockQueue, принтеры
+    забирают их пачками по batch (get_many). Возвращает напечатанные задания
+    в порядке печати.
+    """
+    q = TwoLockQueue(maxsize)
+    printed: list[str] = []
+    printed_lock = threading.Lock()
+    stop = None  # сигнал завершения для принтера
+
+    def producer(part: list[str]) -> None:
+        for job in part:
+            q.put(job)
+
+    def consumer(printer_id: int) -> None:
+        while True:
+            items = q.get_many(batch)
+            for k, job in enumerate(items):
+                if job is stop:
+                    for _ in range(len(items) - k - 1):  # лишние сигналы — другим принтерам
+                        q.put(stop)
+                    return
+                with printed_lock:
+                    printed.append(job)
+                if verbose:
+                    print(f"Принтер {printer_id} печатает: {job}")
+
+    senders = [threading.Thread(target=producer, args=(jobs[i::producers],)) for i in range(producers)]
+    printers = [threading.Thread(target=consumer, args=(i + 1,)) for i in range(consumers)]
+    for t in senders + printers:
+        t.start()
+    for t in senders:
+        t.join()
+    for _ in range(consumers):
+        q.put(stop)
+    for t in printers:
+        t.join()
+    return printed
 
 
 def is_palindrome(seq: str) -> bool:
-    """Проверка палиндрома через deque. Сложность O(n)."""
+    """Проверка палиндрома через deque. Сложность O(n).
+
+    Без копирования в deque: palindromes.is_palindrome.
+    """
     d = deque(seq.lower())  # O(n)
     while len(d) > 1:  # O(n/2)
         if d.popleft() != d.pop():  # O(1)
@@ -36,14 +98,22 @@ if __name__ == "__main__":
     examples = ["(a + b) * [c - d]", "([)]", "{[()()]}", "(()", ""]
     for expr in examples:
         print(f"{expr!r} -> {is_balanced_brackets(expr)}")
+    stream = ["def f(a, b):\n    return {'k': [a, ", "b)}\n"]  # скобка ']' не закрыта до ')'
+    result = check_brackets(stream)
+    print(f"поток из {len(stream)} кусков -> {result.ok}, позиция {result.offset}: {result.message}")
 
     print("\n=== Симуляция очереди печати ===")
     jobs_list = ["Документ1", "Фото2", "Отчет3"]
     print_queue_simulation(jobs_list)
+    print_queue_simulation([PrintJob("Отчет3", 10, priority=0), PrintJob("Фото2", 3, priority=2),
+                            PrintJob("Документ1", 1, priority=1)], policy="priority")
+    print_queue_simulation_mpmc([f"{job}-{i}" for i in range(3) for job in jobs_list], producers=3, consumers=2)
 
     print("\n=== Проверка палиндромов ===")
     words = ["level", "Racecar", "python", "А роза упала на лапу Азора"]
     for word in words:
-        normalized = "".join(ch for ch in word if ch.isalpha())  # убираем пробелы и знаки
+        normalized = normalize(word)  # убираем пробелы и знаки за один проход translate
         print(f"{word!r} -> {is_palindrome(normalized)}")
+    text = "abacdfgdcabba racecar level"
+    print(f"Самый длинный палиндром в {text!r}: {longest_palindrome(text)!r}")
 
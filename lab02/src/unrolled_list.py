@@ -0,0 +1,190 @@
+"""Развёрнутый связный список (unrolled linked list) — дек из блоков (ЛР-02)."""
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Optional
+
+
+class Block:
+    """Блок фиксированной ёмкости: элементы лежат в items[start:end]."""
+
+    __slots__ = ("items", "start", "end", "prev", "next")
+
+    def __init__(self, capacity: int, start: int) -> None:
+        self.items: list[Any] = [None] * capacity
+        self.start: int = start
+        self.end: int = start
+        self.prev: Optional[Block] = None
+        self.next: Optional[Block] = None
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+
+class UnrolledLinkedList:
+    """Двусвязный список блоков по block_size элементов.
+
+    Операции на концах — O(1) амортизированно, доступ по индексу и вставка
+    в середину — O(n / B + B), где B = block_size. Соседние элементы лежат
+    в одном блоке, поэтому обход требует в B раз меньше переходов по ссылкам.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), block_size: int = 64) -> None:
+        if block_size < 2:
+            raise ValueError("block_size must be >= 2")
+        self.block_size: int = block_size
+        self.head: Block = Block(block_size, block_size // 2)
+        self.tail: Block = self.head
+        self._size: int = 0
+        for data in items:
+            self.append(data)
+
+    def __len__(self) -> int:
+        """Количество элементов. Сложность O(1)."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Ленивый обход: O(n) всего, один переход по ссылке на B элементов."""
+        block: Optional[Block] = self.head
+        while block:
+            yield from block.items[block.start:block.end]
+            block = block.next
+
+    def append(self, data: Any) -> None:
+        """Вставка в конец. Сложность O(1) амортизированно."""
+        block = self.tail
+        if block.end == self.block_size:
+            new_block = Block(self.block_size, 0)
+            new_block.prev = block
+            block.next = new_block
+            self.tail = block = new_block
+        block.items[block.end] = data
+        block.end += 1
+        self._size += 1
+
+    def appendleft(self, data: Any) -> None:
+        """Вставка в начало. Сложность O(1) амортизированно."""
+        block = self.head
+        if block.start == 0:
+            new_block = Block(self.block_size, self.block_size)
+            new_block.next = block
+            block.prev = new_block
+            self.head = block = new_block
+        block.start -= 1
+        block.items[block.start] = data
+        self._size += 1
+
+    def pop(self) -> Any:
+        """Удаление из конца. Сложность O(1)."""
+        if not self._size:
+            raise IndexError("pop from an empty UnrolledLinkedList")
+        block = self.tail
+        block.end -= 1
+        data = block.items[block.end]
+        block.items[block.end] = None
+        self._size -= 1
+        self._drop_if_empty(block)
+        return data
+
+    def popleft(self) -> Any:
+        """Удаление из начала. Сложность O(1)."""
+        if not self._size:
+            raise IndexError("pop from an empty UnrolledLinkedList")
+        block = self.head
+        data = block.items[block.start]
+        block.items[block.start] = None
+        block.start += 1
+        self._size -= 1
+        self._drop_if_empty(block)
+        return data
+
+    def _drop_if_empty(self, block: Block) -> None:
+        """Отцепляет пустой блок (единственный блок остаётся, но центрируется)."""
+        if len(block):
+            return
+        if block.prev is None and block.next is None:
+            block.start = block.end = self.block_size // 2
+            return
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+
+    def _locate(self, index: int) -> tuple[Block, int]:
+        """Находит блок и позицию в нём для индекса. Сложность O(n / B)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("UnrolledLinkedList index out of range")
+        if index < self._size // 2:
+            block = self.head
+            while index >= len(block):
+                index -= len(block)
+                block = block.next
+            return block, block.start + index
+        index = self._size - 1 - index  # считаем с конца
+        block = self.tail
+        while index >= len(block):
+            index -= len(block)
+            block = block.prev
+        return block, block.end - 1 - index
+
+    def __getitem__(self, index: int) -> Any:
+        """Доступ по индексу. Сложность O(n / B)."""
+        block, pos = self._locate(index)
+        return block.items[pos]
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        """Замена по индексу. Сложность O(n / B)."""
+        block, pos = self._locate(index)
+        block.items[pos] = data
+
+    def insert(self, index: int, data: Any) -> None:
+        """Вставка перед позицией index. Сложность O(n / B + B).
+
+        Переполненный блок делится пополам, поэтому сдвигается не больше B элементов.
+        """
+        if index < 0:
+            index = max(0, index + self._size)
+        if index >= self._size:
+            self.append(data)
+            return
+        if index == 0:
+            self.appendleft(data)
+            return
+        block, pos = self._locate(index)
+        if len(block) == self.block_size:
+            self._split(block)
+            block, pos = self._locate(index)
+        items = block.items
+        if block.end < self.block_size:
+            items[pos + 1:block.end + 1] = items[pos:block.end]  # сдвиг хвоста блока вправо
+            block.end += 1
+        else:
+            items[block.start - 1:pos - 1] = items[block.start:pos]  # сдвиг головы блока влево
+            block.start -= 1
+            pos -= 1
+        items[pos] = data
+        self._size += 1
+
+    def _split(self, block: Block) -> None:
+        """Делит полный блок на два, вторая половина уходит в новый блок. O(B)."""
+        half = len(block) // 2
+        new_block = Block(self.block_size, 0)
+        moved = block.items[block.start + half:block.end]
+        new_block.items[:len(moved)] = moved
+        new_block.end = len(moved)
+        block.items[block.start + half:block.end] = [None] * len(moved)
+        block.end = block.start + half
+        new_block.prev, new_block.next = block, block.next
+        if block.next:
+            block.next.prev = new_block
+        else:
+            self.tail = new_block
+        block.next = new_block
+
+    def traversal(self) -> list[Any]:
+        """Возвращает список элементов. Сложность O(n)."""
+        return list(self)